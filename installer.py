@@ -6,13 +6,17 @@ This script creates AWS infrastructure resources equivalent to the CDK stack.
 
 import boto3
 import json
+import os
 import time
 import logging
 import argparse
 import base64
+import concurrent.futures
 import ipaddress
+import ssl
 from datetime import datetime
 from typing import Dict, List, Optional
+from botocore.config import Config
 from botocore.exceptions import ClientError
 import urllib.request
 import urllib.error
@@ -29,19 +33,28 @@ vector_index_name = project_name
 custom_header_name = "X-Custom-Header"
 custom_header_value = f"{project_name}_12dab15e4s31"
 
+# Larger connection pool and adaptive retries for clients used concurrently
+concurrent_client_config = Config(
+    max_pool_connections=32,
+    retries=dict(max_attempts=6, mode="adaptive"),
+)
+
 # Initialize boto3 clients
 s3_client = boto3.client("s3", region_name=region)
 iam_client = boto3.client("iam", region_name=region)
 secrets_client = boto3.client("secretsmanager", region_name=region)
 opensearch_client = boto3.client("opensearchserverless", region_name=region)
-ec2_client = boto3.client("ec2", region_name=region)
+ec2_client = boto3.client("ec2", region_name=region, config=concurrent_client_config)
 elbv2_client = boto3.client("elbv2", region_name=region)
 cloudfront_client = boto3.client("cloudfront", region_name=region)
 lambda_client = boto3.client("lambda", region_name=region)
-ssm_client = boto3.client("ssm", region_name=region)
+ssm_client = boto3.client("ssm", region_name=region, config=concurrent_client_config)
 
 bucket_name = f"storage-for-{project_name}-{account_id}-{region}"
 
+# Shared TLS context for readiness probes (loads the CA bundle once)
+ssl_context = ssl.create_default_context()
+
 # Configure logging
 def setup_logging(log_level=logging.INFO):
     """Setup logging configuration."""
@@ -1211,7 +1224,15 @@ def get_or_create_nat_gateway(vpc_id: str, public_subnet_id: str) -> str:
     
     # Create NAT Gateway if it doesn't exist
     logger.info("  Allocating Elastic IP for NAT Gateway...")
-    eip_response = ec2_client.allocate_address(Domain="vpc")
+    eip_response = ec2_client.allocate_address(
+        Domain="vpc",
+        TagSpecifications=[
+            {
+                "ResourceType": "elastic-ip",
+                "Tags": [{"Key": "Name", "Value": f"eip-{project_name}"}]
+            }
+        ]
+    )
     eip_allocation_id = eip_response["AllocationId"]
     
     logger.info("  Creating NAT Gateway (this may take a few minutes)...")
@@ -3740,6 +3761,28 @@ def run_setup_on_existing_instance(instance_id: Optional[str] = None):
     return result
 
 
+def is_subnet_private(subnet: Dict) -> bool:
+    """Return True if the subnet is private (CDK tag or no direct internet gateway route).
+    
+    Args:
+        subnet: Subnet dictionary from AWS describe_subnets response
+    """
+    for tag in subnet.get("Tags", []):
+        if tag["Key"] == "aws-cdk:subnet-type" and tag["Value"] == "Private":
+            return True
+    
+    # If no explicit tag, check route table for internet gateway
+    route_tables = ec2_client.describe_route_tables(
+        Filters=[{"Name": "association.subnet-id", "Values": [subnet["SubnetId"]]}]
+    )
+    has_igw_route = any(
+        route.get("GatewayId", "").startswith("igw-") and route.get("DestinationCidrBlock") == "0.0.0.0/0"
+        for rt in route_tables["RouteTables"]
+        for route in rt["Routes"]
+    )
+    return not has_igw_route
+
+
 def verify_ec2_subnet_deployment():
     """Verify that existing EC2 instances are deployed in private subnets."""
     logger.info("Verifying EC2 subnet deployment...")
@@ -3754,39 +3797,22 @@ def verify_ec2_subnet_deployment():
             ]
         )
         
+        subnet_privacy: Dict[str, tuple] = {}
         for reservation in instances["Reservations"]:
             for instance in reservation["Instances"]:
                 instance_id = instance["InstanceId"]
                 subnet_id = instance["SubnetId"]
                 has_public_ip = instance.get("PublicIpAddress") is not None
                 
-                # Check subnet type
-                subnet_details = ec2_client.describe_subnets(SubnetIds=[subnet_id])
-                subnet = subnet_details["Subnets"][0]
+                # Classify each subnet once, even if several instances share it
+                if subnet_id not in subnet_privacy:
+                    # Check subnet type
+                    subnet_details = ec2_client.describe_subnets(SubnetIds=[subnet_id])
+                    subnet = subnet_details["Subnets"][0]
                 
-                # Determine if subnet is private or public
-                is_private_subnet = False
-                for tag in subnet.get("Tags", []):
-                    if tag["Key"] == "aws-cdk:subnet-type" and tag["Value"] == "Private":
-                        is_private_subnet = True
-                        break
-                
-                # If no explicit tag, check route table for internet gateway
-                if not is_private_subnet:
-                    route_tables = ec2_client.describe_route_tables(
-                        Filters=[{"Name": "association.subnet-id", "Values": [subnet_id]}]
-                    )
-                    for rt in route_tables["RouteTables"]:
-                        for route in rt["Routes"]:
-                            if route.get("GatewayId", "").startswith("igw-") and route.get("DestinationCidrBlock") == "0.0.0.0/0":
-                                # This subnet has direct internet gateway route, so it's public
-                                break
-                        else:
-                            continue
-                        break
-                    else:
-                        # No direct internet gateway route found, likely private
-                        is_private_subnet = True
+                    is_private_subnet = is_subnet_private(subnet)
+                    subnet_privacy[subnet_id] = (subnet, is_private_subnet)
+                subnet, is_private_subnet = subnet_privacy[subnet_id]
                 
                 logger.info(f"  Instance {instance_id}:")
                 logger.info(f"    Subnet: {subnet_id} ({subnet['CidrBlock']})")
@@ -3805,13 +3831,31 @@ def verify_ec2_subnet_deployment():
     except Exception as e:
         logger.debug(f"Could not verify EC2 deployment: {e}")
 
-def check_application_ready(domain: str, max_attempts: int = 120, wait_seconds: int = 10) -> None:
+def probe_application(url: str) -> int:
+    """Send a single readiness probe and return the HTTP status code.
+    
+    Connection failures are raised to the caller.
+    """
+    req = urllib.request.Request(url)
+    req.add_header('User-Agent', 'Mozilla/5.0')
+    try:
+        with urllib.request.urlopen(req, timeout=10, context=ssl_context) as response:
+            return response.getcode()
+    except urllib.error.HTTPError as e:
+        return e.code
+
+
+def check_application_ready(domain: str, max_attempts: int = 120, wait_seconds: int = 10, probes_per_attempt: int = 3) -> None:
     """Check if the application is ready by making HTTP requests to the CloudFront domain.
     
+    Each attempt sends several concurrent probes with different cache-busting query strings
+    so that the first CloudFront edge to serve the application ends the wait.
+    
     Args:
         domain: CloudFront domain name
         max_attempts: Maximum number of attempts to check readiness
         wait_seconds: Seconds to wait between attempts
+        probes_per_attempt: Number of concurrent probes per attempt
     """
     logger.info(f"[10/10] Checking if application is ready at https://{domain}")
     logger.info(f"  Maximum {max_attempts} attempts, {wait_seconds} seconds between attempts (up to {max_attempts * wait_seconds // 60} minutes)")
@@ -3821,58 +3865,73 @@ def check_application_ready(domain: str, max_attempts: int = 120, wait_seconds:
     last_info_time = start_time
     info_interval = 30  # Output progress every 30 seconds
     
-    for attempt in range(max_attempts):
-        current_attempt = attempt + 1
-        progress_percent = (current_attempt / max_attempts) * 100
-        elapsed_time = time.time() - start_time
-        
-        try:
-            req = urllib.request.Request(url)
-            req.add_header('User-Agent', 'Mozilla/5.0')
-            with urllib.request.urlopen(req, timeout=10) as response:
-                if response.getcode() == 200:
-                    elapsed_minutes = elapsed_time / 60
-                    logger.info(f"✓ Application is ready! Status code: {response.getcode()}")
-                    logger.info(f"  Total attempts: {current_attempt}/{max_attempts}, elapsed time: {elapsed_minutes:.1f} minutes")
-                    return
-        except urllib.error.HTTPError as e:
-            # HTTP errors like 502, 503 are expected during deployment
-            if e.code in [502, 503, 504]:
+    with concurrent.futures.ThreadPoolExecutor(max_workers=probes_per_attempt) as executor:
+        for attempt in range(max_attempts):
+            current_attempt = attempt + 1
+            elapsed_time = time.time() - start_time
+            
+            futures = [
+                executor.submit(probe_application, f"{url}/?cb={current_attempt}-{i}")
+                for i in range(probes_per_attempt)
+            ]
+            status_code = None
+            last_error = None
+            try:
+                for future in concurrent.futures.as_completed(futures, timeout=15):
+                    try:
+                        status_code = future.result()
+                    except Exception as e:
+                        last_error = e
+                        continue
+                    if status_code not in [502, 503, 504]:
+                        break
+            except concurrent.futures.TimeoutError as e:
+                last_error = last_error or e
+            for future in futures:
+                future.cancel()
+            
+            if status_code == 200:
+                elapsed_minutes = elapsed_time / 60
+                logger.info(f"✓ Application is ready! Status code: {status_code}")
+                logger.info(f"  Total attempts: {current_attempt}/{max_attempts}, elapsed time: {elapsed_minutes:.1f} minutes")
+                return
+            elif status_code is not None and status_code >= 400 and status_code not in [502, 503, 504]:
+                # Other HTTP errors might indicate the app is responding but with an error
+                elapsed_minutes = elapsed_time / 60
+                logger.info(f"Application responded with HTTP {status_code}, considering it ready")
+                logger.info(f"  Total attempts: {current_attempt}/{max_attempts}, elapsed time: {elapsed_minutes:.1f} minutes")
+                return
+            elif status_code in [502, 503, 504]:
+                # HTTP errors like 502, 503 are expected during deployment
                 current_time = time.time()
                 # Output at info level every 30 seconds, or on first attempt, or during last 10 attempts
                 if (current_time - last_info_time >= info_interval or 
                     current_attempt == 1 or 
                     current_attempt > max_attempts - 10):
-                    logger.info(f"  In progress... [{current_attempt}/{max_attempts}] - HTTP {e.code} response")
+                    logger.info(f"  In progress... [{current_attempt}/{max_attempts}] - HTTP {status_code} response")
                     last_info_time = current_time
                 else:
-                    logger.debug(f"Application not ready yet (attempt {current_attempt}/{max_attempts}): HTTP {e.code}")
+                    logger.debug(f"Application not ready yet (attempt {current_attempt}/{max_attempts}): HTTP {status_code}")
+            elif last_error is not None:
+                current_time = time.time()
+                # Output at info level every 30 seconds, or on first attempt, or during last 10 attempts
+                if (current_time - last_info_time >= info_interval or 
+                    current_attempt == 1 or 
+                    current_attempt > max_attempts - 10):
+                    error_msg = str(last_error)[:100]  # Limit error message length
+                    logger.info(f"  In progress... [{current_attempt}/{max_attempts}] - Connection attempt")
+                    logger.debug(f"  Detailed error: {error_msg}")
+                    last_info_time = current_time
+                else:
+                    logger.debug(f"Application not ready yet (attempt {current_attempt}/{max_attempts}): {last_error}")
+            
+            if attempt < max_attempts - 1:
+                time.sleep(wait_seconds)
             else:
-                # Other HTTP errors might indicate the app is responding but with an error
                 elapsed_minutes = elapsed_time / 60
-                logger.info(f"Application responded with HTTP {e.code}, considering it ready")
-                logger.info(f"  Total attempts: {current_attempt}/{max_attempts}, elapsed time: {elapsed_minutes:.1f} minutes")
-                return
-        except (urllib.error.URLError, OSError, Exception) as e:
-            current_time = time.time()
-            # Output at info level every 30 seconds, or on first attempt, or during last 10 attempts
-            if (current_time - last_info_time >= info_interval or 
-                current_attempt == 1 or 
-                current_attempt > max_attempts - 10):
-                error_msg = str(e)[:100]  # Limit error message length
-                logger.info(f"  In progress... [{current_attempt}/{max_attempts}] - Connection attempt")
-                logger.debug(f"  Detailed error: {error_msg}")
-                last_info_time = current_time
-            else:
-                logger.debug(f"Application not ready yet (attempt {current_attempt*10}/{max_attempts*10}): {e}")
-        
-        if attempt < max_attempts - 1:
-            time.sleep(wait_seconds)
-        else:
-            elapsed_minutes = elapsed_time / 60
-            logger.warning(f"Application readiness check timed out after {max_attempts * wait_seconds} seconds ({elapsed_minutes:.1f} minutes)")
-            logger.warning(f"  Total attempts: {max_attempts}/{max_attempts} (100%)")
-            logger.warning("The application may still be deploying. Please check manually.")
+                logger.warning(f"Application readiness check timed out after {max_attempts * wait_seconds} seconds ({elapsed_minutes:.1f} minutes)")
+                logger.warning(f"  Total attempts: {max_attempts}/{max_attempts} (100%)")
+                logger.warning("The application may still be deploying. Please check manually.")
 
 
 
@@ -4023,8 +4082,11 @@ def main():
         logger.info(f"OpenSearch Collection Endpoint: {opensearch_info['endpoint']}")
         
         try:
-            with open(config_path, 'w') as f:
-                json.dump(config_data, f, indent=2)
+            payload = json.dumps(config_data, indent=2).encode("utf-8")
+            tmp_path = config_path + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, config_path)
             logger.info(f"✓ Updated {config_path}")
         except Exception as e:
             logger.warning(f"Could not update {config_path}: {e}")
@@ -4,6 +4,7 @@ import sys
 import os
 import asyncio
 import contextlib
+import functools
 import utils
 import boto3
 
@@ -25,10 +26,23 @@ logger = logging.getLogger("mcp-basic")
 model_id = "us.anthropic.claude-3-7-sonnet-20250219-v1:0"
 aws_region = utils.bedrock_region
 
-def get_model():
-    STOP_SEQUENCE = "\n\nHuman:" 
-    maxOutputTokens = 4096 # 4k
+_NL_STRIP = str.maketrans('', '', '\n\r')
 
+# Google Workspace tool categories and the name fragments that identify them
+_CATEGORIES = (
+    ("Gmail", ("gmail",)),
+    ("Drive", ("drive",)),
+    ("Calendar", ("event", "calendar")),
+    ("Docs", ("doc",)),
+    ("Sheets", ("sheet", "spreadsheet")),
+    ("Chat", ("chat", "message")),
+    ("Forms", ("form",)),
+    ("Slides", ("presentation", "slide")),
+    ("Tasks", ("task",)),
+)
+
+@functools.lru_cache(maxsize=1)
+def _bedrock_client():
     # Bedrock client configuration
     bedrock_config = Config(
         read_timeout=900,
@@ -36,12 +50,19 @@ def get_model():
         retries=dict(max_attempts=3, mode="adaptive"),
     )
     
-    bedrock_client = boto3.client(
+    # botocore clients are thread-safe, so one instance is shared by all agents
+    return boto3.client(
         'bedrock-runtime',
         region_name=aws_region,
         config=bedrock_config
     )
 
+def get_model():
+    STOP_SEQUENCE = "\n\nHuman:" 
+    maxOutputTokens = 4096 # 4k
+
+    bedrock_client = _bedrock_client()
+
     model = BedrockModel(
         client=bedrock_client,
         model_id=model_id,
@@ -57,6 +78,7 @@ def get_model():
     )
     return model
 
+@functools.lru_cache(maxsize=1)
 def load_mcp_config():
     config = None
     
@@ -98,7 +120,13 @@ def create_agent(system_prompt):
         
         tool_list = get_tool_list(google_tools)
         logger.info(f"Google Workspace tools loaded: {len(tool_list)} tools")
-        logger.info(f"Tool categories: Gmail({len([t for t in tool_list if 'gmail' in t.lower()])}), Drive({len([t for t in tool_list if 'drive' in t.lower()])}), Calendar({len([t for t in tool_list if 'event' in t.lower() or 'calendar' in t.lower()])}), Docs({len([t for t in tool_list if 'doc' in t.lower()])}), Sheets({len([t for t in tool_list if 'sheet' in t.lower() or 'spreadsheet' in t.lower()])}), Chat({len([t for t in tool_list if 'chat' in t.lower() or 'message' in t.lower()])}), Forms({len([t for t in tool_list if 'form' in t.lower()])}), Slides({len([t for t in tool_list if 'presentation' in t.lower() or 'slide' in t.lower()])}), Tasks({len([t for t in tool_list if 'task' in t.lower()])})")
+        counts = {category: 0 for category, _ in _CATEGORIES}
+        for t in tool_list:
+            name = t.lower()
+            for category, needles in _CATEGORIES:
+                if any(needle in name for needle in needles):
+                    counts[category] += 1
+        logger.info(f"Tool categories: {', '.join(f'{k}({v})' for k, v in counts.items())}")
         
         # system prompt
         if system_prompt is None:
@@ -130,28 +158,30 @@ def get_tool_info(tool_name, tool_content):
         else:
             json_data = json.loads(tool_content)
         
-        logger.info(f"json_data: {json_data}")
-        if isinstance(json_data, dict) and "path" in json_data:  # path
-            path = json_data["path"]
-            if isinstance(path, list):
-                for url in path:
-                    urls.append(url)
-            else:
-                urls.append(path)            
-
-        for item in json_data:
-            logger.info(f"item: {item}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("json_data: %s", json_data)
+        items = json_data if isinstance(json_data, list) else [json_data]
+        for item in items:
+            logger.debug("item: %s", item)
+            if not isinstance(item, dict):
+                continue
+            if "path" in item:  # path
+                path = item["path"]
+                if isinstance(path, list):
+                    urls.extend(path)
+                else:
+                    urls.append(path)
             if "reference" in item and "contents" in item:
                 url = item["reference"]["url"]
                 title = item["reference"]["title"]
                 content_text = item["contents"][:200] + "..." if len(item["contents"]) > 200 else item["contents"]
-                content_text = content_text.replace("\n", "")
+                content_text = content_text.translate(_NL_STRIP)
                 tool_references.append({
                     "url": url,
                     "title": title,
                     "content": content_text
                 })
-        logger.info(f"tool_references: {tool_references}")
+        logger.info("tool_references: %s", tool_references)
 
     except json.JSONDecodeError:
         pass
@@ -161,45 +191,46 @@ def get_tool_info(tool_name, tool_content):
 def get_reference(references):
     ref = ""
     if references:
-        ref = "\n\n### Reference\n"
-        for i, reference in enumerate(references):
-            ref += f"{i+1}. [{reference['title']}]({reference['url']}), {reference['content']}...\n"        
+        ref = "\n\n### Reference\n" + "".join(
+            f"{i+1}. [{reference['title']}]({reference['url']}), {reference['content']}...\n"
+            for i, reference in enumerate(references)
+        )
     return ref
 
 async def show_streams(agent_stream):
     tool_name = ""
     result = ""
-    current_response = ""
     references = []
 
     async for event in agent_stream:
         # logger.info(f"event: {event}")
         if "message" in event:
             message = event["message"]
-            logger.info(f"message: {message}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("message: %s", message)
 
             for content in message["content"]:      
-                logger.info(f"content: {content}")          
+                logger.debug("content: %s", content)
                 if "text" in content:
-                    logger.info(f"text: {content['text']}")
+                    logger.info("text: %s", content['text'])
 
                     result = content['text']
-                    current_response = ""
 
                 if "toolUse" in content:
                     tool_use = content["toolUse"]
-                    logger.info(f"tool_use: {tool_use}")
+                    logger.info("tool_use: %s", tool_use)
                     
                     tool_name = tool_use["name"]
                     input = tool_use["input"]
                     
-                    logger.info(f"tool_nmae: {tool_name}, arg: {input}")
+                    logger.info("tool_name: %s, arg: %s", tool_name, input)
             
                 refs = []
                 if "toolResult" in content:
                     tool_result = content["toolResult"]
-                    logger.info(f"tool_name: {tool_name}")
-                    logger.info(f"tool_result: {tool_result}")
+                    logger.info("tool_name: %s", tool_name)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("tool_result: %s", tool_result)
                     if "content" in tool_result:
                         tool_content = tool_result['content']
                         for content in tool_content:
@@ -207,44 +238,32 @@ async def show_streams(agent_stream):
                                 content, urls, refs = get_tool_info(tool_name, content['text'])
                                 for r in refs:
                                     references.append(r)
-                                    logger.info(f"refs: {r}")
+                                    logger.info("refs: %s", r)
 
-        if "data" in event:
-            text_data = event["data"]
-            current_response += text_data
-            continue
-        
     # get reference
     result += get_reference(references)
     
     return result
 
+def _slow_fallback(tool, index):
+    tool_str = str(tool)
+    if tool_str.startswith("<module 'strands_tools."):
+        return tool_str.split("'")[1].split('.')[-1]
+    if 'MCPAgentTool' in tool_str:
+        # Try to extract tool name from MCP tool
+        try:
+            return tool.tool.name
+        except AttributeError:
+            return f"MCP_Tool_{index}"
+    return tool_str
+
 def get_tool_list(tools):
     tool_list = []
     for tool in tools:
-        if hasattr(tool, 'tool_name'):  # MCP tool
-            tool_list.append(tool.tool_name)
-        elif hasattr(tool, 'name'):  # MCP tool with name attribute
-            tool_list.append(tool.name)
-        elif hasattr(tool, '__name__'):  # Function or module
-            tool_list.append(tool.__name__)
-        elif str(tool).startswith("<module 'strands_tools."):   
-            module_name = str(tool).split("'")[1].split('.')[-1]
-            tool_list.append(module_name)
-        else:
-            # For MCP tools that might have different structure
-            tool_str = str(tool)
-            if 'MCPAgentTool' in tool_str:
-                # Try to extract tool name from MCP tool
-                try:
-                    if hasattr(tool, 'tool'):
-                        tool_list.append(tool.tool.name)
-                    else:
-                        tool_list.append(f"MCP_Tool_{len(tool_list)}")
-                except:
-                    tool_list.append(f"MCP_Tool_{len(tool_list)}")
-            else:
-                tool_list.append(str(tool))
+        name = getattr(tool, 'tool_name', None) or getattr(tool, 'name', None) or getattr(tool, '__name__', None)
+        if name is None:
+            name = _slow_fallback(tool, len(tool_list))
+        tool_list.append(name)
     return tool_list
 
 async def mcp_google():
@@ -2,19 +2,31 @@ import json
 import logging
 import sys
 import os
+import random
+import time
 import asyncio
-import contextlib
+import functools
+import itertools
+import traceback
+import types
 import utils
-import knowledge_base
 import boto3
 
 from typing import Dict, List, Optional
 from strands.tools.mcp import MCPClient
+from strands.types.exceptions import MCPClientInitializationError
 from mcp import stdio_client, StdioServerParameters
-from contextlib import contextmanager
 from strands import Agent
 from strands.models import BedrockModel
 from botocore.config import Config
+from botocore.exceptions import HTTPClientError, ConnectionError as BotocoreConnectionError
+from urllib3.exceptions import ProtocolError, NewConnectionError
+
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
 
 logging.basicConfig(
     level=logging.INFO,  # Default to INFO level
@@ -25,21 +37,53 @@ logging.basicConfig(
 )
 logger = logging.getLogger("mcp-basic")
 
+@functools.lru_cache(maxsize=1)
+def _load_mcp_config_cached(config_path, mtime):
+    with open(config_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+_last_mcp_config = None
+
 def load_mcp_config():
-    config = None
+    """Load mcp.json, re-parsing it only when the file has been modified"""
+    global _last_mcp_config
     
     script_dir = os.path.dirname(os.path.abspath(__file__))
     config_path = os.path.join(script_dir, "mcp.json")
     
-    with open(config_path, "r", encoding="utf-8") as f:
-        config = json.load(f)
+    try:
+        mtime = os.stat(config_path).st_mtime_ns
+    except OSError as e:
+        if _last_mcp_config is not None:
+            logger.warning("Could not stat %s, using last loaded config: %s", config_path, e)
+            return _last_mcp_config
+        raise
     
-    return config
+    _last_mcp_config = _load_mcp_config_cached(config_path, mtime)
+    return _last_mcp_config
+
+# Transient failures of an MCP stdio server (crashed subprocess, broken pipe, slow start)
+RETRYABLE_MCP_ERRORS = (MCPClientInitializationError, BrokenPipeError, ConnectionError, EOFError, TimeoutError)
+
+def retry_with_backoff(fn, attempts: int = 3, base: float = 0.2):
+    """Call fn, retrying retryable MCP errors with exponential backoff and jitter"""
+    for attempt in range(attempts):
+        try:
+            return fn()
+        except RETRYABLE_MCP_ERRORS as e:
+            if attempt == attempts - 1:
+                raise
+            delay = base * 2**attempt + random.random() * 0.1
+            logger.warning("MCP call failed (%s/%s), retrying in %.2fs: %s", attempt + 1, attempts, delay, e)
+            time.sleep(delay)
 
 class MCPClientManager:
     def __init__(self):
         self.clients: Dict[str, MCPClient] = {}
         self.client_configs: Dict[str, dict] = {}  # Store client configurations
+        self.server_params: Dict[str, StdioServerParameters] = {}  # Built once per client
+        self.connected: Dict[str, MCPClient] = {}  # Clients with a live stdio session
+        self.tool_cache: Dict[str, list] = {}  # Tools listed during the current session
         
     def add_client(self, name: str, command: str, args: List[str], env: dict[str, str] = {}) -> None:
         """Add a new MCP client configuration (lazy initialization)"""
@@ -48,152 +92,223 @@ class MCPClientManager:
             "args": args,
             "env": env
         }
-        logger.info(f"Stored configuration for MCP client: {name}")
+        self.server_params[name] = StdioServerParameters(command=command, args=args, env=env)
+        logger.info("Stored configuration for MCP client: %s", name)
     
     def get_client(self, name: str) -> Optional[MCPClient]:
         """Get or create MCP client (lazy initialization)"""
         if name not in self.client_configs:
-            logger.warning(f"No configuration found for MCP client: {name}")
+            logger.warning("No configuration found for MCP client: %s", name)
             return None
             
         if name not in self.clients:
             # Create client on first use
             config = self.client_configs[name]
-            logger.info(f"Creating MCP client for {name} with config: {config}")
+            logger.info("Creating MCP client for %s with config: %s", name, config)
             try:
-                self.clients[name] = MCPClient(lambda: stdio_client(
-                    StdioServerParameters(
-                        command=config["command"], 
-                        args=config["args"], 
-                        env=config["env"]
-                    )
-                ))
-                logger.info(f"Successfully created MCP client: {name}")
+                self.clients[name] = MCPClient(lambda params=self.server_params[name]: stdio_client(params))
+                logger.info("Successfully created MCP client: %s", name)
             except Exception as e:
-                logger.error(f"Failed to create MCP client {name}: {e}")
-                logger.error(f"Exception type: {type(e)}")
+                logger.error("Failed to create MCP client %s: %s", name, e)
+                logger.error("Exception type: %s", type(e))
                 import traceback
-                logger.error(f"Traceback: {traceback.format_exc()}")
+                logger.error("Traceback: %s", traceback.format_exc())
                 return None
         else:
-            logger.info(f"Reusing existing MCP client: {name}")
+            logger.info("Reusing existing MCP client: %s", name)
                 
         return self.clients[name]
     
+    def connect(self, name: str) -> Optional[MCPClient]:
+        """Start the stdio session of an MCP client if it is not running yet"""
+        if name in self.connected:
+            return self.connected[name]
+
+        def start():
+            client = self.get_client(name)
+            if client:
+                try:
+                    client.__enter__()
+                except Exception:
+                    # a failed start leaves the client unusable, so build a fresh one on retry
+                    self.clients.pop(name, None)
+                    raise
+            return client
+
+        client = retry_with_backoff(start)
+        if client:
+            self.connected[name] = client
+            logger.info("Connected MCP client: %s", name)
+        return client
+
+    def disconnect(self, name: str) -> None:
+        """Stop the stdio session of an MCP client"""
+        client = self.connected.pop(name, None)
+        self.tool_cache.pop(name, None)
+        if client:
+            client.__exit__(None, None, None)
+            logger.info("Disconnected MCP client: %s", name)
+    
+    def shutdown(self) -> None:
+        """Stop every live stdio session (call once when the process is done with MCP)"""
+        for name in list(self.connected):
+            try:
+                self.disconnect(name)
+            except Exception as e:
+                logger.error("Failed to disconnect MCP client %s: %s", name, e)
+
     def remove_client(self, name: str) -> None:
         """Remove an MCP client"""
+        self.disconnect(name)
         if name in self.clients:
             del self.clients[name]
         if name in self.client_configs:
             del self.client_configs[name]
+        self.server_params.pop(name, None)
     
-    @contextmanager
-    def get_active_clients(self, active_clients: List[str]):
-        """Manage active clients context"""
-        logger.info(f"active_clients: {active_clients}")
-        active_contexts = []
-        try:
-            for client_name in active_clients:
-                client = self.get_client(client_name)
-                if client:
-                    active_contexts.append(client)
-
-            # logger.info(f"active_contexts: {active_contexts}")
-            if active_contexts:
-                with contextlib.ExitStack() as stack:
-                    for client in active_contexts:
-                        stack.enter_context(client)
-                    yield
-            else:
-                yield
-        except Exception as e:
-            logger.error(f"Error in MCP client context: {e}")
-            raise
+    async def connect_all(self, names: List[str]) -> List[str]:
+        """Connect MCP clients concurrently and return the names that were newly connected"""
+        pending = [name for name in names if name not in self.connected]
+        # MCPClient.__enter__ blocks until the server handshake completes, so run each in a worker thread
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self.connect, name) for name in pending),
+            return_exceptions=True
+        )
+        opened = []
+        for name, result in zip(pending, results):
+            if isinstance(result, Exception):
+                logger.error("Failed to connect MCP client %s: %s", name, result)
+            elif result:
+                opened.append(name)
+        return opened
 
 # Initialize MCP client manager
 mcp_manager = MCPClientManager()
 
-def update_tools(mcp_servers: list):
-    tools = []
-    mcp_servers_loaded = 0
-    for mcp_tool in mcp_servers:
-        logger.info(f"Processing MCP tool: {mcp_tool}")        
-        try:
-            with mcp_manager.get_active_clients([mcp_tool]) as _:
-                client = mcp_manager.get_client(mcp_tool)
-                if client:
-                    logger.info(f"Got client for {mcp_tool}, attempting to list tools...")
-                    mcp_servers_list = client.list_tools_sync()
-                    logger.info(f"{mcp_tool}_tools: {mcp_servers_list}")
-                    if mcp_servers_list:
-                        tools.extend(mcp_servers_list)
-                        mcp_servers_loaded += 1
-                        logger.info(f"Successfully added {len(mcp_servers_list)} tools from {mcp_tool}")
-                    else:
-                        logger.warning(f"No tools returned from {mcp_tool}")
-                else:
-                    logger.error(f"Failed to get client for {mcp_tool}")
-        except Exception as e:
-            logger.error(f"Error getting tools for {mcp_tool}: {e}")
-            logger.error(f"Exception type: {type(e)}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
-            continue
+def list_server_tools(mcp_tool: str) -> list:
+    """List the tools of one MCP server that is already connected through mcp_manager"""
+    logger.info("Processing MCP tool: %s", mcp_tool)        
+    try:
+        client = mcp_manager.connected.get(mcp_tool)
+        if mcp_tool in mcp_manager.tool_cache:
+            mcp_servers_list = mcp_manager.tool_cache[mcp_tool]
+            logger.info("Reusing %s cached tools from %s", len(mcp_servers_list), mcp_tool)
+            return mcp_servers_list
+        elif client:
+            logger.info("Got client for %s, attempting to list tools...", mcp_tool)
+            mcp_servers_list = retry_with_backoff(client.list_tools_sync)
+            mcp_manager.tool_cache[mcp_tool] = mcp_servers_list
+            # log tool names only; the full schemas are large
+            logger.info("%s_tools: %s", mcp_tool, get_tool_list(mcp_servers_list))
+            if mcp_servers_list:
+                logger.info("Successfully added %s tools from %s", len(mcp_servers_list), mcp_tool)
+            else:
+                logger.warning("No tools returned from %s", mcp_tool)
+            return mcp_servers_list or []
+        else:
+            logger.error("Failed to get client for %s", mcp_tool)
+    except Exception as e:
+        logger.error("Error getting tools for %s: %s", mcp_tool, e)
+        logger.error("Exception type: %s", type(e))
+        logger.error("Traceback: %s", traceback.format_exc())
+    return []
+
+async def update_tools(mcp_servers: list):
+    """List the tools of connected MCP servers, querying every server concurrently"""
+    # drop duplicate server names so no session is listed twice
+    seen = set()
+    mcp_servers = [s for s in mcp_servers if not (s in seen or seen.add(s))]
+
+    # list_tools_sync() blocks on each client's own loop thread, so run each in a worker thread
+    results = await asyncio.gather(
+        *(asyncio.to_thread(list_server_tools, mcp_tool) for mcp_tool in mcp_servers)
+    )
+    tools = list(itertools.chain.from_iterable(results))
+    mcp_servers_loaded = sum(1 for server_tools in results if server_tools)
 
-    logger.info(f"Successfully loaded {mcp_servers_loaded} out of {len(mcp_servers)} MCP tools")
-    logger.info(f"tools: {tools}")
+    logger.info("Successfully loaded %s out of %s MCP tools", mcp_servers_loaded, len(mcp_servers))
+    logger.debug("tools: %s", tools)
 
     return tools
 
 # Set up MCP clients
 def init_mcp_clients(config: dict):
     if not config or "mcpServers" not in config:
-        logger.warning(f"No configuration found")
+        logger.warning("No configuration found")
         return
 
-    logger.info(f"Initializing MCP clients")
+    logger.info("Initializing MCP clients")
 
     for server_key, server_config in config["mcpServers"].items():
-        logger.info(f"server_key: {server_key}")
+        logger.info("server_key: %s", server_key)
 
         if server_key:
-            logger.info(f"server_config: {server_config}")
+            logger.info("server_config: %s", server_config)
             
             name = server_key  
             command = server_config["command"]
             args = server_config["args"]
             env = server_config.get("env", {})  # Use empty dict if env is not present                
-            logger.info(f"Adding MCP client - name: {name}, command: {command}, args: {args}, env: {env}")        
+            logger.info("Adding MCP client - name: %s, command: %s, args: %s, env: %s", name, command, args, env)        
 
             try:
                 mcp_manager.add_client(name, command, args, env)
-                logger.info(f"Successfully added MCP client for {name}")
+                logger.info("Successfully added MCP client for %s", name)
             except Exception as e:
-                logger.error(f"Failed to add MCP client for {name}: {e}")
+                logger.error("Failed to add MCP client for %s: %s", name, e)
                 continue
 
 model_id = "us.anthropic.claude-3-7-sonnet-20250219-v1:0"
 aws_region = utils.bedrock_region
 
-def get_model():
-    STOP_SEQUENCE = "\n\nHuman:" 
-    maxOutputTokens = 4096 # 4k
+# one session for the process so resolved credentials are shared by every client
+_boto_session = boto3.Session()
 
+@functools.lru_cache(maxsize=None)
+def _get_bedrock_client(region):
     # Bedrock client configuration
     bedrock_config = Config(
         read_timeout=900,
         connect_timeout=900,
+        tcp_keepalive=True,
+        max_pool_connections=100,
         retries=dict(max_attempts=3, mode="adaptive"),
     )
     
-    bedrock_client = boto3.client(
+    # one pooled client per region, shared by every agent created in this process
+    return _boto_session.client(
         'bedrock-runtime',
-        region_name=aws_region,
+        region_name=region,
         config=bedrock_config
     )
 
+def invalidate_runtime_client(region):
+    """Drop the cached Bedrock client so the next get_model() opens a fresh connection pool"""
+    logger.info("Invalidating cached bedrock-runtime client for %s", region)
+    # lru_cache cannot evict a single key; clients for other regions are rebuilt lazily
+    _get_bedrock_client.cache_clear()
+
+def is_stale_connection_error(exc):
+    """Check whether an exception comes from a dead pooled HTTPS connection"""
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        seen.add(id(exc))
+        if isinstance(exc, (HTTPClientError, BotocoreConnectionError, ProtocolError, NewConnectionError)):
+            return True
+        if isinstance(exc, AssertionError):
+            for frame, _ in traceback.walk_tb(exc.__traceback__):
+                module = frame.f_globals.get("__name__", "")
+                if module.startswith(("urllib3.", "botocore.")):
+                    return True
+        exc = exc.__cause__ or exc.__context__
+    return False
+
+def get_model(bedrock_client=None):
+    STOP_SEQUENCE = "\n\nHuman:" 
+    maxOutputTokens = 4096 # 4k
+
     model = BedrockModel(
-        client=bedrock_client,
+        client=bedrock_client or _get_bedrock_client(aws_region),
         model_id=model_id,
         max_tokens=maxOutputTokens,
         stop_sequences = [STOP_SEQUENCE],
@@ -207,7 +322,8 @@ def get_model():
     )
     return model
 
-def create_agent(system_prompt, tools):
+def create_agent(system_prompt, tools, bedrock_client=None):
+    """Create an agent; pass bedrock_client to share one connection pool across agents"""
     if system_prompt==None:
         system_prompt = (
             "You are an experienced QA Engineer."
@@ -215,7 +331,7 @@ def create_agent(system_prompt, tools):
             "If you don't know the answer to a question, honestly say you don't know."
         )
 
-    model = get_model()
+    model = get_model(bedrock_client)
     agent = Agent(
         model=model,
         system_prompt=system_prompt,
@@ -229,140 +345,171 @@ def get_tool_list(tools):
         if hasattr(tool, 'tool_name'):  # MCP tool
             tool_list.append(tool.tool_name)
                 
-        if str(tool).startswith("<module 'strands_tools."):   
-            module_name = str(tool).split("'")[1].split('.')[-1]
-            tool_list.append(module_name)
+        if isinstance(tool, types.ModuleType) and tool.__name__.startswith("strands_tools."):
+            tool_list.append(tool.__name__.rsplit(".", 1)[-1])
     return tool_list
 
-def get_tool_info(tool_name, tool_content):
+def parse_tool_content(tool_content):
+    """Parse a tool result once; returns None when the text is not JSON"""
+    if isinstance(tool_content, (dict, list)):
+        return tool_content
+    try:
+        return json_loads(tool_content)
+    except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses it
+        return None
+
+def get_tool_info(tool_name, json_data):
+    """Extract urls and references from a tool result already parsed by parse_tool_content()"""
     tool_references = []    
     urls = []
     content = ""
 
-    try:
-        if isinstance(tool_content, dict):
-            json_data = tool_content
-        elif isinstance(tool_content, list):
-            json_data = tool_content
+    if not isinstance(json_data, (dict, list)):
+        return content, urls, tool_references
+
+    logger.info("json_data: %s", json_data)
+    if isinstance(json_data, dict) and "path" in json_data:  # path
+        path = json_data["path"]
+        if isinstance(path, list):
+            for url in path:
+                urls.append(url)
         else:
-            json_data = json.loads(tool_content)
-        
-        logger.info(f"json_data: {json_data}")
-        if isinstance(json_data, dict) and "path" in json_data:  # path
-            path = json_data["path"]
-            if isinstance(path, list):
-                for url in path:
-                    urls.append(url)
-            else:
-                urls.append(path)            
-
-        for item in json_data:
-            logger.info(f"item: {item}")
-            if "reference" in item and "contents" in item:
-                url = item["reference"]["url"]
-                title = item["reference"]["title"]
-                content_text = item["contents"][:200] + "..." if len(item["contents"]) > 200 else item["contents"]
-                content_text = content_text.replace("\n", "")
-                tool_references.append({
-                    "url": url,
-                    "title": title,
-                    "content": content_text
-                })
-        logger.info(f"tool_references: {tool_references}")
-
-    except json.JSONDecodeError:
-        pass
+            urls.append(path)            
+
+    for item in json_data:
+        logger.info("item: %s", item)
+        if "reference" in item and "contents" in item:
+            url = item["reference"]["url"]
+            title = item["reference"]["title"]
+            content_text = item["contents"][:200] + "..." if len(item["contents"]) > 200 else item["contents"]
+            content_text = content_text.replace("\n", "")
+            tool_references.append({
+                "url": url,
+                "title": title,
+                "content": content_text
+            })
+    logger.info("tool_references: %s", tool_references)
 
     return content, urls, tool_references
 
 def get_reference(references):
     ref = ""
     if references:
-        ref = "\n\n### Reference\n"
-        for i, reference in enumerate(references):
-            ref += f"{i+1}. [{reference['title']}]({reference['url']}), {reference['content']}...\n"        
+        ref = "\n\n### Reference\n" + "".join(
+            f"{i+1}. [{reference['title']}]({reference['url']}), {reference['content']}...\n"
+            for i, reference in enumerate(references)
+        )
     return ref
 
-async def show_streams(agent_stream):
+async def show_streams(agent_stream, output=None):
+    """Consume the agent stream; if output is given, streamed text is written to it as it arrives
+
+    Only the final turn is kept in output: when the model starts a new turn after a
+    tool call, the text of the previous turn is truncated away.
+    """
     tool_name = ""
     result = ""
-    current_response = ""
     references = []
+    turn_done = False  # a "message" event closed the turn that is currently in output
 
     async for event in agent_stream:
         # logger.info(f"event: {event}")
         if "message" in event:
             message = event["message"]
-            logger.info(f"message: {message}")
+            logger.info("message: %s", message)
+            turn_done = True
 
             for content in message["content"]:      
-                logger.info(f"content: {content}")          
+                logger.info("content: %s", content)          
                 if "text" in content:
-                    logger.info(f"text: {content['text']}")
+                    logger.info("text: %s", content['text'])
 
                     result = content['text']
-                    current_response = ""
 
                 if "toolUse" in content:
                     tool_use = content["toolUse"]
-                    logger.info(f"tool_use: {tool_use}")
+                    logger.info("tool_use: %s", tool_use)
                     
                     tool_name = tool_use["name"]
                     input = tool_use["input"]
                     
-                    logger.info(f"tool_nmae: {tool_name}, arg: {input}")
+                    logger.info("tool_name: %s, arg: %s", tool_name, input)
             
                 refs = []
                 if "toolResult" in content:
                     tool_result = content["toolResult"]
-                    logger.info(f"tool_name: {tool_name}")
-                    logger.info(f"tool_result: {tool_result}")
+                    logger.info("tool_name: %s", tool_name)
+                    logger.info("tool_result: %s", tool_result)
                     if "content" in tool_result:
                         tool_content = tool_result['content']
                         for content in tool_content:
                             if "text" in content:
-                                content, urls, refs = get_tool_info(tool_name, content['text'])
+                                content, urls, refs = get_tool_info(tool_name, parse_tool_content(content['text']))
                                 for r in refs:
                                     references.append(r)
-                                    logger.info(f"refs: {r}")
+                                    logger.info("refs: %s", r)
 
         if "data" in event:
             text_data = event["data"]
-            current_response += text_data
+            if output is not None:
+                if turn_done:
+                    output.seek(0)
+                    output.truncate()
+                    turn_done = False
+                output.write(text_data)
+                output.flush()
             continue
         
     # get reference
-    result += get_reference(references)
+    reference = get_reference(references)
+    if output is not None:
+        output.write(reference)
+        output.flush()
+    result += reference
     
     return result
 
 async def loader():
     config = load_mcp_config()
-    logger.info(f"config: {config}")
+    logger.info("config: %s", config)
 
     query = "9-2. 픽업필터 off일시"
 
     # initialize mcp clients
     init_mcp_clients(config)
 
-    # load tools
     mcp_servers = ["knowledge_base_lambda", "awslabs.aws-documentation-mcp-server"]
-    tools = update_tools(mcp_servers)
-    tool_list = get_tool_list(tools)
-    logger.info(f"tool_list: {tool_list}")
-
-    # run agent
-    agent = create_agent(system_prompt=None, tools=tools)
-    with mcp_manager.get_active_clients(mcp_servers) as _:
-        agent_stream = agent.stream_async(f"KnowledgeBase를 이용해 {query}에 대한 정보를 조회하고, test하기 위한 test case를 작성해주세요.")
+    # keep the server sessions open for the whole run; shutdown() closes them at the end
+    await mcp_manager.connect_all(mcp_servers)
+    try:
+        # load tools
+        tools = await update_tools(mcp_servers)
+        tool_list = get_tool_list(tools)
+        logger.info("tool_list: %s", tool_list)
 
-        result = await show_streams(agent_stream)
+        # run agent
+        bedrock_client = _get_bedrock_client(aws_region)
+        agent = create_agent(system_prompt=None, tools=tools, bedrock_client=bedrock_client)
+        prompt = f"KnowledgeBase를 이용해 {query}에 대한 정보를 조회하고, test하기 위한 test case를 작성해주세요."
 
-        # save result to file
+        # stream the result to file as it is generated
         with open("test_case.md", "w", encoding="utf-8") as f:
-            f.write(result)
-
-    logger.info(f"result: {result}")    
+            try:
+                result = await show_streams(agent.stream_async(prompt), f)
+            except Exception as e:
+                if not is_stale_connection_error(e):
+                    raise
+                logger.warning("Stale Bedrock connection, retrying with a new client: %s", e)
+                invalidate_runtime_client(aws_region)
+                f.seek(0)
+                f.truncate()
+                bedrock_client = _get_bedrock_client(aws_region)
+                agent = create_agent(system_prompt=None, tools=tools, bedrock_client=bedrock_client)
+                result = await show_streams(agent.stream_async(prompt), f)
+    finally:
+        mcp_manager.shutdown()
+
+    logger.info("result: %s", result)    
     
 if __name__ == "__main__":
     asyncio.run(loader())
\ No newline at end of file
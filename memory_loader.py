@@ -4,6 +4,8 @@ import sys
 import os
 import asyncio
 import contextlib
+import functools
+import traceback
 import utils
 import boto3
 
@@ -11,8 +13,16 @@ from typing import Dict, List, Optional
 from strands import Agent
 from strands.models import BedrockModel
 from botocore.config import Config
+from botocore.exceptions import HTTPClientError, ConnectionError as BotocoreConnectionError
+from urllib3.exceptions import ProtocolError, NewConnectionError
 from strands_tools import memory, retrieve
 
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 logging.basicConfig(
     level=logging.INFO,  # Default to INFO level
     format='%(filename)s:%(lineno)d | %(message)s',
@@ -25,25 +35,54 @@ logger = logging.getLogger("mcp-basic")
 model_id = "us.anthropic.claude-3-7-sonnet-20250219-v1:0"
 aws_region = utils.bedrock_region
 
-def get_model():
-    STOP_SEQUENCE = "\n\nHuman:" 
-    maxOutputTokens = 4096 # 4k
+# one session for the process so resolved credentials are shared by every client
+_boto_session = boto3.Session()
 
+@functools.lru_cache(maxsize=None)
+def _get_bedrock_client(region):
     # Bedrock client configuration
     bedrock_config = Config(
         read_timeout=900,
         connect_timeout=900,
+        tcp_keepalive=True,
+        max_pool_connections=100,
         retries=dict(max_attempts=3, mode="adaptive"),
     )
     
-    bedrock_client = boto3.client(
+    # one pooled client per region, shared by every agent created in this process
+    return _boto_session.client(
         'bedrock-runtime',
-        region_name=aws_region,
+        region_name=region,
         config=bedrock_config
     )
 
+def invalidate_runtime_client(region):
+    """Drop the cached Bedrock client so the next get_model() opens a fresh connection pool"""
+    logger.info("Invalidating cached bedrock-runtime client for %s", region)
+    # lru_cache cannot evict a single key; clients for other regions are rebuilt lazily
+    _get_bedrock_client.cache_clear()
+
+def is_stale_connection_error(exc):
+    """Check whether an exception comes from a dead pooled HTTPS connection"""
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        seen.add(id(exc))
+        if isinstance(exc, (HTTPClientError, BotocoreConnectionError, ProtocolError, NewConnectionError)):
+            return True
+        if isinstance(exc, AssertionError):
+            for frame, _ in traceback.walk_tb(exc.__traceback__):
+                module = frame.f_globals.get("__name__", "")
+                if module.startswith(("urllib3.", "botocore.")):
+                    return True
+        exc = exc.__cause__ or exc.__context__
+    return False
+
+def get_model(bedrock_client=None):
+    STOP_SEQUENCE = "\n\nHuman:" 
+    maxOutputTokens = 4096 # 4k
+
     model = BedrockModel(
-        client=bedrock_client,
+        client=bedrock_client or _get_bedrock_client(aws_region),
         model_id=model_id,
         max_tokens=maxOutputTokens,
         stop_sequences = [STOP_SEQUENCE],
@@ -57,7 +96,8 @@ def get_model():
     )
     return model
 
-def create_agent(system_prompt):
+def create_agent(system_prompt, bedrock_client=None):
+    """Create an agent; pass bedrock_client to share one connection pool across agents"""
     if system_prompt==None:
         system_prompt = (
             "You are an experienced QA Engineer."
@@ -65,7 +105,7 @@ def create_agent(system_prompt):
             "If you don't know the answer to a question, honestly say you don't know."
         )
 
-    model = get_model()
+    model = get_model(bedrock_client)
     agent = Agent(
         model=model,
         system_prompt=system_prompt,
@@ -74,105 +114,122 @@ def create_agent(system_prompt):
     
     return agent
 
-def get_tool_info(tool_name, tool_content):
+def parse_tool_content(tool_content):
+    """Parse a tool result once; returns None when the text is not JSON"""
+    if isinstance(tool_content, (dict, list)):
+        return tool_content
+    try:
+        return json_loads(tool_content)
+    except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses it
+        return None
+
+def get_tool_info(tool_name, json_data):
+    """Extract urls and references from a tool result already parsed by parse_tool_content()"""
     tool_references = []    
     urls = []
     content = ""
 
-    try:
-        if isinstance(tool_content, dict):
-            json_data = tool_content
-        elif isinstance(tool_content, list):
-            json_data = tool_content
+    if not isinstance(json_data, (dict, list)):
+        return content, urls, tool_references
+
+    logger.info("json_data: %s", json_data)
+    if isinstance(json_data, dict) and "path" in json_data:  # path
+        path = json_data["path"]
+        if isinstance(path, list):
+            urls.extend(path)
         else:
-            json_data = json.loads(tool_content)
-        
-        logger.info(f"json_data: {json_data}")
-        if isinstance(json_data, dict) and "path" in json_data:  # path
-            path = json_data["path"]
-            if isinstance(path, list):
-                for url in path:
-                    urls.append(url)
-            else:
-                urls.append(path)            
-
-        for item in json_data:
-            logger.info(f"item: {item}")
-            if "reference" in item and "contents" in item:
-                url = item["reference"]["url"]
-                title = item["reference"]["title"]
-                content_text = item["contents"][:200] + "..." if len(item["contents"]) > 200 else item["contents"]
-                content_text = content_text.replace("\n", "")
-                tool_references.append({
-                    "url": url,
-                    "title": title,
-                    "content": content_text
-                })
-        logger.info(f"tool_references: {tool_references}")
+            urls.append(path)            
 
-    except json.JSONDecodeError:
-        pass
+    for item in json_data:
+        logger.info("item: %s", item)
+        if "reference" in item and "contents" in item:
+            contents = item["contents"]
+            content_text = (contents[:200] + "...") if len(contents) > 200 else contents
+            if "\n" in content_text:
+                content_text = content_text.replace("\n", "")
+            tool_references.append({
+                "url": item["reference"]["url"],
+                "title": item["reference"]["title"],
+                "content": content_text
+            })
+    logger.info("tool_references: %s", tool_references)
 
     return content, urls, tool_references
 
 def get_reference(references):
     ref = ""
     if references:
-        ref = "\n\n### Reference\n"
-        for i, reference in enumerate(references):
-            ref += f"{i+1}. [{reference['title']}]({reference['url']}), {reference['content']}...\n"        
+        ref = "\n\n### Reference\n" + "".join(
+            f"{i+1}. [{reference['title']}]({reference['url']}), {reference['content']}...\n"
+            for i, reference in enumerate(references)
+        )
     return ref
 
-async def show_streams(agent_stream):
+async def show_streams(agent_stream, output=None):
+    """Consume the agent stream; if output is given, streamed text is written to it as it arrives
+
+    Only the final turn is kept in output: when the model starts a new turn after a
+    tool call, the text of the previous turn is truncated away.
+    """
     tool_name = ""
     result = ""
-    current_response = ""
     references = []
+    turn_done = False  # a "message" event closed the turn that is currently in output
 
     async for event in agent_stream:
         # logger.info(f"event: {event}")
         if "message" in event:
             message = event["message"]
-            logger.info(f"message: {message}")
+            logger.info("message: %s", message)
+            turn_done = True
 
             for content in message["content"]:      
-                logger.info(f"content: {content}")          
+                logger.info("content: %s", content)          
                 if "text" in content:
-                    logger.info(f"text: {content['text']}")
+                    logger.info("text: %s", content['text'])
 
                     result = content['text']
-                    current_response = ""
 
                 if "toolUse" in content:
                     tool_use = content["toolUse"]
-                    logger.info(f"tool_use: {tool_use}")
+                    logger.info("tool_use: %s", tool_use)
                     
                     tool_name = tool_use["name"]
                     input = tool_use["input"]
                     
-                    logger.info(f"tool_nmae: {tool_name}, arg: {input}")
+                    logger.info("tool_name: %s, arg: %s", tool_name, input)
             
                 refs = []
                 if "toolResult" in content:
                     tool_result = content["toolResult"]
-                    logger.info(f"tool_name: {tool_name}")
-                    logger.info(f"tool_result: {tool_result}")
+                    logger.info("tool_name: %s", tool_name)
+                    logger.info("tool_result: %s", tool_result)
                     if "content" in tool_result:
                         tool_content = tool_result['content']
                         for content in tool_content:
                             if "text" in content:
-                                content, urls, refs = get_tool_info(tool_name, content['text'])
+                                content, urls, refs = get_tool_info(tool_name, parse_tool_content(content['text']))
                                 for r in refs:
                                     references.append(r)
-                                    logger.info(f"refs: {r}")
+                                    logger.info("refs: %s", r)
 
         if "data" in event:
             text_data = event["data"]
-            current_response += text_data
+            if output is not None:
+                if turn_done:
+                    output.seek(0)
+                    output.truncate()
+                    turn_done = False
+                output.write(text_data)
+                output.flush()
             continue
         
     # get reference
-    result += get_reference(references)
+    reference = get_reference(references)
+    if output is not None:
+        output.write(reference)
+        output.flush()
+    result += reference
     
     return result
 
@@ -180,7 +237,8 @@ async def loader():
     query = "9-2. 픽업필터 off일시"
     
     # create agent
-    agent = create_agent(system_prompt=None)
+    bedrock_client = _get_bedrock_client(aws_region)
+    agent = create_agent(system_prompt=None, bedrock_client=bedrock_client)
 
     # memory
     # results = agent.tool.memory(
@@ -198,8 +256,9 @@ async def loader():
     #             text = item.get('text')            
     #             logger.info(f"text: {text}")
 
-    # retrieve
-    results = agent.tool.retrieve(
+    # retrieve (blocking boto3 call, so keep it off the event loop)
+    results = await asyncio.to_thread(
+        agent.tool.retrieve,
         text=query,
         numberOfResults=5,
         score=0.2,
@@ -207,24 +266,34 @@ async def loader():
         region="us-west-2"
     )
 
-    text = ""
+    texts = []
     if "content" in results:
         content = results.get('content')
         for item in content:
             if "text" in item:
-                text = item.get('text')            
-                logger.info(f"text: {text}")
+                texts.append(item['text'])
+                logger.info("text: %s", item['text'])
+    text = "\n\n".join(texts)
 
     prompt = f"Question: 아래의 context를 참조하여, {query}를 test하기 위한 test case를 작성해주세요.\n\n<context>{text}</context>"
-    logger.info(f"prompt: {prompt}")
-
-    agent_stream = agent.stream_async(prompt)
-    result = await show_streams(agent_stream)
-
-    logger.info(f"result: {result}")
+    logger.info("prompt: %s", prompt)
 
+    # stream the result to file as it is generated
     with open("test_case.md", "w", encoding="utf-8") as f:
-         f.write(result)
+        try:
+            result = await show_streams(agent.stream_async(prompt), f)
+        except Exception as e:
+            if not is_stale_connection_error(e):
+                raise
+            logger.warning("Stale Bedrock connection, retrying with a new client: %s", e)
+            invalidate_runtime_client(aws_region)
+            f.seek(0)
+            f.truncate()
+            bedrock_client = _get_bedrock_client(aws_region)
+            agent = create_agent(system_prompt=None, bedrock_client=bedrock_client)
+            result = await show_streams(agent.stream_async(prompt), f)
+
+    logger.info("result: %s", result)
 
 if __name__ == "__main__":
     asyncio.run(loader())
\ No newline at end of file
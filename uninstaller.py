@@ -6,25 +6,40 @@ This script deletes all AWS infrastructure resources created by installer.py.
 
 import boto3
 import time
+import random
 import logging
-from botocore.exceptions import ClientError
+import concurrent.futures
+import functools
+import threading
+from botocore.config import Config
+from botocore.exceptions import ClientError, WaiterError
 
 # Configuration
 project_name = "woo-project"
 region = "us-west-2"
 
-sts_client = boto3.client("sts", region_name=region)
+# Adaptive retries and a larger connection pool for clients shared by the deletion thread pools
+client_config = Config(
+    retries=dict(max_attempts=10, mode="adaptive"),
+    max_pool_connections=50,
+    connect_timeout=5,
+    read_timeout=30,
+)
+
+sts_client = boto3.client("sts", region_name=region, config=client_config)
 account_id = sts_client.get_caller_identity()["Account"]
 
 # Initialize boto3 clients
-s3_client = boto3.client("s3", region_name=region)
-iam_client = boto3.client("iam", region_name=region)
-secrets_client = boto3.client("secretsmanager", region_name=region)
-opensearch_client = boto3.client("opensearchserverless", region_name=region)
-ec2_client = boto3.client("ec2", region_name=region)
-elbv2_client = boto3.client("elbv2", region_name=region)
-cloudfront_client = boto3.client("cloudfront", region_name=region)
-bedrock_agent_client = boto3.client("bedrock-agent", region_name=region)
+s3_client = boto3.client("s3", region_name=region, config=client_config)
+iam_client = boto3.client("iam", region_name=region, config=client_config)
+secrets_client = boto3.client("secretsmanager", region_name=region, config=client_config)
+opensearch_client = boto3.client("opensearchserverless", region_name=region, config=client_config)
+ec2_client = boto3.client("ec2", region_name=region, config=client_config)
+elbv2_client = boto3.client("elbv2", region_name=region, config=client_config)
+cloudfront_client = boto3.client("cloudfront", region_name=region, config=client_config)
+bedrock_agent_client = boto3.client("bedrock-agent", region_name=region, config=client_config)
+bedrock_agentcore_client = boto3.client("bedrock-agentcore-control", region_name=region, config=client_config)
+tagging_client = boto3.client("resourcegroupstaggingapi", region_name=region, config=client_config)
 
 # Get account ID if not set
 if not account_id:
@@ -43,69 +58,285 @@ def setup_logging():
 
 logger = setup_logging()
 
-def delete_cloudfront_distributions():
-    """Delete CloudFront distributions."""
+# Throttling errors are re-raised instead of swallowed so callers and the adaptive retryer can back off
+throttling_error_codes = {"RequestLimitExceeded", "Throttling", "ThrottlingException"}
+
+# Errors meaning the resource is already gone; deletion treats them as success
+not_found_error_codes = {
+    "InvalidVpcEndpointId.NotFound", "LoadBalancerNotFound", "TargetGroupNotFound",
+    "InvalidRoute.NotFound", "InvalidAllocationID.NotFound", "InvalidPermission.NotFound",
+    "InvalidGroup.NotFound", "InvalidGroupId.NotFound", "InvalidAssociationID.NotFound",
+    "InvalidRouteTableID.NotFound", "InvalidVpcID.NotFound", "ResourceNotFoundException",
+    "NoSuchEntity", "NoSuchBucket",
+}
+
+# Network interfaces owned by AWS services; they are released when the owning resource is deleted
+managed_eni_types = {"lambda", "nat_gateway", "vpc_endpoint", "network_load_balancer", "gateway_load_balancer_endpoint"}
+
+# Upper bound on concurrent boto3 calls issued within a single deletion phase
+max_parallel_calls = 20
+
+# Largest page size each operation accepts, so every round-trip returns as many items as possible
+max_page_sizes = {
+    "describe_instances": 1000,
+    "describe_vpcs": 1000,
+    "describe_subnets": 1000,
+    "describe_security_groups": 1000,
+    "describe_security_group_rules": 1000,
+    "describe_network_interfaces": 1000,
+    "describe_nat_gateways": 1000,
+    "describe_vpc_endpoints": 1000,
+    "describe_route_tables": 100,
+    "list_knowledge_bases": 100,
+    "list_data_sources": 100,
+}
+
+def describe_all(client, operation, **kwargs):
+    """Call a paginated describe/list operation and merge every page into a single response.
+
+    Without pagination these calls silently stop after the first page (typically 50-1000
+    items), which leaves orphaned resources behind in larger accounts.
+    """
+    if operation in max_page_sizes:
+        kwargs.setdefault("PaginationConfig", {"PageSize": max_page_sizes[operation]})
+    return client.get_paginator(operation).paginate(**kwargs).build_full_result()
+
+def run_parallel(fn, items, max_workers=max_parallel_calls):
+    """Call fn for every item on a thread pool and wait for all calls to finish.
+
+    boto3 clients are thread-safe, so independent calls within one phase can overlap.
+    Returning only after every call has completed keeps the ordering between phases.
+
+    Returns:
+        list: Return values of fn, in the same order as items.
+    """
+    items = list(items)
+    if not items:
+        return []
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        futures = [executor.submit(fn, item) for item in items]
+        concurrent.futures.wait(futures)
+    return [future.result() for future in futures]
+
+def run_dag(tasks, max_workers=None):
+    """Run teardown tasks concurrently, starting each one as soon as its dependencies finish.
+
+    Args:
+        tasks: Dict mapping task name to a (function, dependency names) tuple
+        max_workers: Thread count; defaults to one per task so a ready task never waits for a slot
+
+    A task that raises is logged and recorded instead of aborting the run; its dependents
+    still start, since each teardown step looks up whatever resources are left.
+
+    Returns:
+        tuple: (dict of return values keyed by task name with None for failed tasks,
+            dict of the exceptions raised by failed tasks)
+    """
+    results = {}
+    errors = {}
+    pending = dict(tasks)
+    running = {}
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers or len(tasks)) as executor:
+        while pending or running:
+            for name, (fn, deps) in list(pending.items()):
+                if all(dep in results for dep in deps):
+                    running[executor.submit(fn)] = name
+                    del pending[name]
+
+            if not running:
+                raise ValueError(f"Unresolvable task dependencies: {sorted(pending)}")
+
+            done, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    logger.exception(f"Teardown step {name} failed: {e}")
+                    results[name] = None
+                    errors[name] = e
+
+    return results, errors
+
+def backoff_delay(attempt, base=15, cap=300):
+    """Full-jitter delay before retrying a DependencyViolation.
+
+    botocore's adaptive mode already retries throttling, but dependency errors
+    clear only as AWS finishes detaching resources, so callers still retry them.
+    Full jitter averages half the exponential delay, so callers allow one more
+    attempt than a fixed schedule would need.
+    """
+    return random.uniform(0, min(base * (2 ** attempt), cap))
+
+def wait_until_gone(exists, not_found_code, max_wait=300, max_delay=30):
+    """Poll with exponential backoff until a resource no longer exists.
+
+    Returns as soon as the resource is gone instead of sleeping for a fixed interval.
+
+    Args:
+        exists: Callable returning True while the resource still exists
+        not_found_code: Error code raised by exists() once the resource is gone
+        max_wait: Maximum number of seconds to wait
+        max_delay: Upper bound for the delay between polls
+
+    Returns:
+        bool: True if the resource is gone, False if max_wait elapsed first.
+    """
+    deadline = time.monotonic() + max_wait
+    delay = 1
+    while True:
+        try:
+            if not exists():
+                return True
+        except ClientError as e:
+            if e.response["Error"]["Code"] == not_found_code:
+                return True
+            if e.response["Error"]["Code"] not in throttling_error_codes:
+                raise
+            # Throttled: skip ahead in the backoff schedule instead of failing the wait
+            delay = min(delay * 2, max_delay)
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        # Jitter keeps concurrent pollers from hitting the API in lockstep
+        time.sleep(min(delay + random.uniform(0, 1), remaining))
+        delay = min(delay * 2, max_delay)
+
+def delete_vpc_endpoint_batch(endpoint_ids):
+    """Delete VPC endpoints with one DeleteVpcEndpoints call per 25 IDs."""
+    for i in range(0, len(endpoint_ids), 25):
+        batch = endpoint_ids[i:i+25]
+        try:
+            response = ec2_client.delete_vpc_endpoints(VpcEndpointIds=batch)
+        except ClientError as e:
+            if e.response["Error"]["Code"] in throttling_error_codes:
+                raise
+            logger.warning(f"    Could not delete VPC endpoints {batch}: {e}")
+            continue
+        
+        failed = {}
+        for item in response.get("Unsuccessful", []):
+            if item["Error"]["Code"] not in not_found_error_codes:
+                failed[item["ResourceId"]] = item["Error"]["Message"]
+        for endpoint_id in batch:
+            if endpoint_id in failed:
+                logger.warning(f"    Could not delete VPC endpoint {endpoint_id}: {failed[endpoint_id]}")
+            else:
+                logger.info(f"    ✓ Initiated deletion of VPC endpoint: {endpoint_id}")
+
+def wait_for_vpc_endpoints_gone(endpoint_ids, max_wait=300):
+    """Wait for VPC endpoints to be deleted, checking all of them with one describe per poll.
+
+    Returns:
+        list: IDs of the endpoints that still exist after max_wait seconds.
+    """
+    remaining = set(endpoint_ids)
+
+    def any_remaining():
+        # A vpc-endpoint-id filter, unlike VpcEndpointIds, does not fail once an endpoint is gone
+        endpoints = describe_all(ec2_client, "describe_vpc_endpoints",
+            Filters=[{"Name": "vpc-endpoint-id", "Values": list(remaining)}]
+        )["VpcEndpoints"]
+        still_there = {endpoint["VpcEndpointId"] for endpoint in endpoints if endpoint["State"] != "deleted"}
+        for endpoint_id in remaining - still_there:
+            logger.debug("      VPC endpoint %s confirmed deleted", endpoint_id)
+        remaining.intersection_update(still_there)
+        return bool(remaining)
+
+    if not remaining:
+        return []
+    try:
+        wait_until_gone(any_remaining, "InvalidVpcEndpointId.NotFound", max_wait=max_wait)
+    except ClientError as e:
+        logger.debug("      Error checking VPC endpoints: %s", e)
+        return []
+    return sorted(remaining)
+
+def wait_for_distribution_deployed(dist_id: str, max_wait=900, max_delay=60):
+    """Poll a CloudFront distribution with exponential backoff until its changes are deployed.
+
+    Returns:
+        str: Current ETag of the deployed distribution, or None if max_wait elapsed first.
+    """
+    waited = 0
+    delay = 5
+    while True:
+        response = cloudfront_client.get_distribution(Id=dist_id)
+        if response["Distribution"]["Status"] == "Deployed":
+            return response["ETag"]
+
+        if waited >= max_wait:
+            return None
+        time.sleep(delay)
+        waited += delay
+        delay = min(delay * 2, max_delay)
+
+def process_cloudfront():
+    """Disable and then delete the project's CloudFront distributions in a single pass."""
     logger.info("[1/9] Deleting CloudFront distributions")
     
     try:
-        distributions = cloudfront_client.list_distributions()
-        for dist in distributions.get("DistributionList", {}).get("Items", []):
-            if project_name in dist.get("Comment", ""):
+        # ETag returned by update_distribution, so the delete does not need another get_distribution_config
+        etag_cache = {}
+        
+        paginator = cloudfront_client.get_paginator("list_distributions")
+        for page in paginator.paginate():
+            for dist in page.get("DistributionList", {}).get("Items", []):
+                if project_name not in dist.get("Comment", ""):
+                    continue
+                
                 dist_id = dist["Id"]
+                if not dist.get("Enabled", True):
+                    etag_cache[dist_id] = None
+                    continue
+                
                 logger.info(f"  Disabling distribution: {dist_id}")
                 
                 # Get current config
                 config_response = cloudfront_client.get_distribution_config(Id=dist_id)
                 config = config_response["DistributionConfig"]
-                etag = config_response["ETag"]
                 
                 # Disable distribution
                 config["Enabled"] = False
-                cloudfront_client.update_distribution(
+                update_response = cloudfront_client.update_distribution(
                     Id=dist_id,
                     DistributionConfig=config,
-                    IfMatch=etag
+                    IfMatch=config_response["ETag"]
                 )
+                etag_cache[dist_id] = update_response["ETag"]
                 
                 logger.info(f"  Distribution {dist_id} disabled, will be deleted after deployment")
         
-        logger.info("✓ CloudFront distributions processed")
-    except Exception as e:
-        logger.error(f"Error processing CloudFront distributions: {e}")
-
-def delete_disabled_cloudfront_distributions():
-    """Delete disabled CloudFront distributions."""
-    logger.info("Deleting disabled CloudFront distributions")
-    
-    try:
-        distributions = cloudfront_client.list_distributions()
-        for dist in distributions.get("DistributionList", {}).get("Items", []):
-            if project_name in dist.get("Comment", "") and not dist.get("Enabled", True):
-                dist_id = dist["Id"]
-                logger.info(f"  Deleting disabled distribution: {dist_id}")
+        def delete_distribution(dist_id):
+            try:
+                # Fall back to the cached ETag if deployment has not finished within the wait
+                etag = wait_for_distribution_deployed(dist_id) or etag_cache[dist_id]
+                if etag is None:
+                    logger.info(f"  Distribution {dist_id} is not fully disabled yet, skipping")
+                    return
                 
-                try:
-                    # Get current config and ETag
-                    config_response = cloudfront_client.get_distribution_config(Id=dist_id)
-                    etag = config_response["ETag"]
-                    
-                    # Delete distribution
-                    cloudfront_client.delete_distribution(
-                        Id=dist_id,
-                        IfMatch=etag
-                    )
-                    logger.info(f"  ✓ Deleted distribution: {dist_id}")
-                except ClientError as e:
-                    if e.response["Error"]["Code"] == "DistributionNotDisabled":
-                        logger.info(f"  Distribution {dist_id} is not fully disabled yet, skipping")
-                    elif e.response["Error"]["Code"] == "NoSuchDistribution":
-                        logger.debug(f"  Distribution {dist_id} already deleted")
-                    else:
-                        logger.warning(f"  Could not delete distribution {dist_id}: {e}")
+                logger.info(f"  Deleting disabled distribution: {dist_id}")
+                cloudfront_client.delete_distribution(
+                    Id=dist_id,
+                    IfMatch=etag
+                )
+                logger.info(f"  ✓ Deleted distribution: {dist_id}")
+            except ClientError as e:
+                if e.response["Error"]["Code"] == "DistributionNotDisabled":
+                    logger.info(f"  Distribution {dist_id} is not fully disabled yet, skipping")
+                elif e.response["Error"]["Code"] == "NoSuchDistribution":
+                    logger.debug("  Distribution %s already deleted", dist_id)
+                else:
+                    logger.warning(f"  Could not delete distribution {dist_id}: {e}")
+        
+        run_parallel(delete_distribution, list(etag_cache))
         
-        logger.info("✓ Disabled CloudFront distributions processed")
+        logger.info("✓ CloudFront distributions processed")
     except Exception as e:
-        logger.error(f"Error deleting disabled CloudFront distributions: {e}")
+        logger.error(f"Error processing CloudFront distributions: {e}")
 
 def delete_alb_resources():
     """Delete ALB, target groups, and listeners."""
@@ -120,131 +351,165 @@ def delete_alb_resources():
                 alb_arn = albs["LoadBalancers"][0]["LoadBalancerArn"]
                 
                 # Delete listeners first
-                listeners = elbv2_client.describe_listeners(LoadBalancerArn=alb_arn)
-                for listener in listeners["Listeners"]:
-                    elbv2_client.delete_listener(ListenerArn=listener["ListenerArn"])
-                    logger.info(f"  ✓ Deleted listener: {listener['ListenerArn']}")
+                listeners = describe_all(elbv2_client, "describe_listeners", LoadBalancerArn=alb_arn)
+
+                def delete_listener(listener_arn):
+                    elbv2_client.delete_listener(ListenerArn=listener_arn)
+                    logger.info(f"  ✓ Deleted listener: {listener_arn}")
+
+                run_parallel(delete_listener, [listener["ListenerArn"] for listener in listeners["Listeners"]])
                 
                 # Delete ALB
                 elbv2_client.delete_load_balancer(LoadBalancerArn=alb_arn)
                 logger.info(f"  ✓ Deleted ALB: {alb_name}")
                 
                 # Wait for ALB to be deleted
-                time.sleep(30)
+                try:
+                    elbv2_client.get_waiter("load_balancers_deleted").wait(
+                        LoadBalancerArns=[alb_arn],
+                        WaiterConfig={"Delay": 5, "MaxAttempts": 24}
+                    )
+                except WaiterError as e:
+                    logger.warning(f"  ALB {alb_name} not fully deleted yet: {e}")
         except ClientError as e:
-            if e.response["Error"]["Code"] != "LoadBalancerNotFound":
+            if e.response["Error"]["Code"] not in not_found_error_codes:
                 raise
         
-        # Delete target groups after ALB is deleted
-        tgs = elbv2_client.describe_target_groups()
+        # Delete target groups after ALB is deleted; the installer uses a fixed name, so look it up directly
+        try:
+            tgs = describe_all(elbv2_client, "describe_target_groups", Names=[f"TG-for-{project_name}"])
+        except ClientError as e:
+            if e.response["Error"]["Code"] not in not_found_error_codes:
+                raise
+            tgs = {"TargetGroups": []}
         for tg in tgs["TargetGroups"]:
-            if f"TG-for-{project_name}" in tg["TargetGroupName"]:
-                try:
-                    elbv2_client.delete_target_group(TargetGroupArn=tg["TargetGroupArn"])
-                    logger.info(f"  ✓ Deleted target group: {tg['TargetGroupName']}")
-                except ClientError as e:
-                    if e.response["Error"]["Code"] != "ResourceInUse":
-                        logger.warning(f"  Could not delete target group {tg['TargetGroupName']}: {e}")
+            try:
+                elbv2_client.delete_target_group(TargetGroupArn=tg["TargetGroupArn"])
+                logger.info(f"  ✓ Deleted target group: {tg['TargetGroupName']}")
+            except ClientError as e:
+                if e.response["Error"]["Code"] != "ResourceInUse":
+                    logger.warning(f"  Could not delete target group {tg['TargetGroupName']}: {e}")
         
         logger.info("✓ ALB resources deleted")
     except Exception as e:
         logger.error(f"Error deleting ALB resources: {e}")
 
+# NAT gateways already cleaned up by delete_nat_gateways, so delete_single_vpc can skip them
+cleaned_nat_gw_ids = set()
+
+def cleanup_nat_gateway(nat_gw, rt_index=None) -> str:
+    """Remove the routes that reference a NAT gateway and then delete it.
+
+    Args:
+        nat_gw: NAT gateway description from describe_nat_gateways
+        rt_index: Route tables of the NAT gateway's VPC keyed by ID; described on demand if omitted
+
+    Returns:
+        str: The NAT gateway ID if deletion was initiated, otherwise None.
+    """
+    nat_gw_id = nat_gw["NatGatewayId"]
+    logger.info(f"  Deleting NAT gateway: {nat_gw_id}")
+
+    # First, remove all routes that reference this NAT gateway
+    routes_to_remove = []
+    try:
+        if rt_index is None:
+            rt_index = {
+                rt["RouteTableId"]: rt
+                for rt in describe_all(ec2_client, "describe_route_tables",
+                    Filters=[{"Name": "vpc-id", "Values": [nat_gw["VpcId"]]}]
+                )["RouteTables"]
+            }
+        for rt_id, rt in rt_index.items():
+            for route in rt["Routes"]:
+                if route.get("NatGatewayId") == nat_gw_id:
+                    routes_to_remove.append((rt_id, route["DestinationCidrBlock"]))
+    except Exception as route_cleanup_error:
+        logger.warning(f"    Error cleaning up routes for NAT gateway {nat_gw_id}: {route_cleanup_error}")
+
+    def remove_route(route):
+        rt_id, cidr = route
+        try:
+            ec2_client.delete_route(
+                RouteTableId=rt_id,
+                DestinationCidrBlock=cidr
+            )
+            logger.info(f"    ✓ Removed route {cidr} -> {nat_gw_id} from route table {rt_id}")
+        except ClientError as route_error:
+            if route_error.response["Error"]["Code"] not in not_found_error_codes:
+                logger.warning(f"    Could not remove route from {rt_id}: {route_error}")
+
+    run_parallel(remove_route, routes_to_remove)
+
+    # Wait a moment for route deletion to propagate
+    if routes_to_remove:
+        time.sleep(5)
+
+    # Now delete the NAT gateway
+    try:
+        ec2_client.delete_nat_gateway(NatGatewayId=nat_gw_id)
+        logger.info(f"    ✓ Deleted NAT Gateway: {nat_gw_id}")
+    except ClientError as nat_error:
+        logger.warning(f"    Could not delete NAT gateway {nat_gw_id}: {nat_error}")
+        return None
+
+    cleaned_nat_gw_ids.add(nat_gw_id)
+    return nat_gw_id
+
 def delete_nat_gateways():
     """Delete NAT gateways and their associated routes."""
     logger.info("[3.5/9] Deleting NAT gateways")
     
     try:
-        # Get all NAT gateways that match the project name
-        nat_gws = ec2_client.describe_nat_gateways()
-        project_nat_gws = []
-        
-        for nat_gw in nat_gws["NatGateways"]:
-            if nat_gw["State"] not in ["deleted", "deleting"]:
-                # Check if NAT gateway has project name in tags
-                nat_gw_id = nat_gw["NatGatewayId"]
-                try:
-                    tags_response = ec2_client.describe_tags(
-                        Filters=[
-                            {"Name": "resource-id", "Values": [nat_gw_id]},
-                            {"Name": "resource-type", "Values": ["nat-gateway"]}
-                        ]
-                    )
-                    for tag in tags_response.get("Tags", []):
-                        if tag.get("Key") == "Name" and project_name in tag.get("Value", ""):
-                            project_nat_gws.append(nat_gw)
-                            logger.info(f"  Found NAT gateway to delete: {nat_gw_id} ({tag.get('Value')})")
-                            break
-                except Exception as e:
-                    logger.debug(f"  Error checking tags for NAT gateway {nat_gw_id}: {e}")
+        # Get all NAT gateways that match the project name, filtered server-side
+        nat_gws = describe_all(ec2_client, "describe_nat_gateways",
+            Filter=[
+                {"Name": "tag:Name", "Values": [f"*{project_name}*"]},
+                {"Name": "state", "Values": ["available", "pending", "failed"]}
+            ]
+        )
+        project_nat_gws = nat_gws["NatGateways"]
+        
+        for nat_gw in project_nat_gws:
+            name = next((tag["Value"] for tag in nat_gw.get("Tags", []) if tag.get("Key") == "Name"), "")
+            logger.info(f"  Found NAT gateway to delete: {nat_gw['NatGatewayId']} ({name})")
         
         if not project_nat_gws:
             logger.info("  No NAT gateways found to delete")
             return
         
-        # Delete each NAT gateway
-        deleted_nat_gw_ids = []
-        for nat_gw in project_nat_gws:
-            nat_gw_id = nat_gw["NatGatewayId"]
-            vpc_id = nat_gw["VpcId"]
-            
-            logger.info(f"  Deleting NAT gateway: {nat_gw_id}")
-            
-            # First, remove all routes that reference this NAT gateway
-            try:
-                route_tables = ec2_client.describe_route_tables(
-                    Filters=[{"Name": "vpc-id", "Values": [vpc_id]}]
-                )
-                for rt in route_tables["RouteTables"]:
-                    routes_to_remove = []
-                    for route in rt["Routes"]:
-                        if route.get("NatGatewayId") == nat_gw_id:
-                            routes_to_remove.append(route)
-                    
-                    # Remove routes that reference this NAT gateway
-                    for route in routes_to_remove:
-                        try:
-                            ec2_client.delete_route(
-                                RouteTableId=rt["RouteTableId"],
-                                DestinationCidrBlock=route["DestinationCidrBlock"]
-                            )
-                            logger.info(f"    ✓ Removed route {route['DestinationCidrBlock']} -> {nat_gw_id} from route table {rt['RouteTableId']}")
-                        except ClientError as route_error:
-                            if route_error.response["Error"]["Code"] != "InvalidRoute.NotFound":
-                                logger.warning(f"    Could not remove route from {rt['RouteTableId']}: {route_error}")
-            except Exception as route_cleanup_error:
-                logger.warning(f"    Error cleaning up routes for NAT gateway {nat_gw_id}: {route_cleanup_error}")
-            
-            # Wait a moment for route deletion to propagate
-            time.sleep(5)
-            
-            # Now delete the NAT gateway
-            try:
-                ec2_client.delete_nat_gateway(NatGatewayId=nat_gw_id)
-                logger.info(f"    ✓ Deleted NAT Gateway: {nat_gw_id}")
-                deleted_nat_gw_ids.append(nat_gw_id)
-            except ClientError as nat_error:
-                logger.warning(f"    Could not delete NAT gateway {nat_gw_id}: {nat_error}")
-        
+        vpc_ids = sorted({nat_gw["VpcId"] for nat_gw in project_nat_gws})
+
+        # One route table lookup shared by every NAT gateway
+        rt_index = None
+        try:
+            rt_index = {
+                rt["RouteTableId"]: rt
+                for rt in describe_all(ec2_client, "describe_route_tables",
+                    Filters=[{"Name": "vpc-id", "Values": vpc_ids}]
+                )["RouteTables"]
+            }
+        except Exception as route_cleanup_error:
+            logger.warning(f"    Error listing routes for NAT gateways: {route_cleanup_error}")
+
+        deleted_nat_gw_ids = [
+            nat_gw_id for nat_gw_id in run_parallel(
+                lambda nat_gw: cleanup_nat_gateway(nat_gw, rt_index),
+                project_nat_gws
+            )
+            if nat_gw_id
+        ]
+
         # Wait for NAT gateways to be deleted only if there are any being deleted
         if deleted_nat_gw_ids:
-            # Check if any NAT gateways are still in deleting state
+            logger.info(f"  Waiting for {len(deleted_nat_gw_ids)} NAT gateway(s) to be deleted...")
             try:
-                nat_gws_status = ec2_client.describe_nat_gateways(NatGatewayIds=deleted_nat_gw_ids)
-                deleting_nat_gws = [
-                    ngw for ngw in nat_gws_status.get("NatGateways", [])
-                    if ngw["State"] == "deleting"
-                ]
-                
-                if deleting_nat_gws:
-                    logger.info(f"  Waiting for {len(deleting_nat_gws)} NAT gateway(s) to be deleted...")
-                    time.sleep(60)
-            except ClientError as e:
-                # If NAT gateways are already deleted, describe_nat_gateways will fail
-                if e.response["Error"]["Code"] == "InvalidNatGatewayID.NotFound":
-                    logger.debug("  NAT gateways already deleted")
-                else:
-                    logger.debug(f"  Could not check NAT gateway status: {e}")
+                ec2_client.get_waiter("nat_gateway_deleted").wait(
+                    NatGatewayIds=deleted_nat_gw_ids,
+                    WaiterConfig={"Delay": 5, "MaxAttempts": 60}
+                )
+            except WaiterError as e:
+                logger.debug("  Could not confirm NAT gateway deletion: %s", e)
         
         logger.info("✓ NAT gateways deleted")
     except Exception as e:
@@ -255,7 +520,7 @@ def delete_ec2_instances():
     logger.info("[3/9] Deleting EC2 instances")
     
     try:
-        instances = ec2_client.describe_instances(
+        instances = describe_all(ec2_client, "describe_instances",
             Filters=[
                 {"Name": "tag:Name", "Values": [f"app-for-{project_name}"]},
                 {"Name": "instance-state-name", "Values": ["running", "pending", "stopping", "stopped"]}
@@ -272,8 +537,9 @@ def delete_ec2_instances():
             logger.info(f"  ✓ Terminated instances: {instance_ids}")
             
             # Wait for termination
+            # Poll every 5s instead of the default 15s so the VPC teardown can start sooner
             waiter = ec2_client.get_waiter('instance_terminated')
-            waiter.wait(InstanceIds=instance_ids)
+            waiter.wait(InstanceIds=instance_ids, WaiterConfig={"Delay": 5, "MaxAttempts": 120})
             logger.info("  ✓ Instances terminated")
         
         logger.info("✓ EC2 instances deleted")
@@ -289,230 +555,237 @@ def delete_single_vpc(vpc_id: str) -> bool:
     logger.info(f"  Deleting VPC: {vpc_id}")
     
     try:
+        # Describe route tables once; both NAT route cleanup and route table deletion use this index
+        rt_index = {
+            rt["RouteTableId"]: rt
+            for rt in describe_all(ec2_client, "describe_route_tables",
+                Filters=[{"Name": "vpc-id", "Values": [vpc_id]}]
+            )["RouteTables"]
+        }
+
         # Delete VPC endpoints first with comprehensive waiting
         try:
-            endpoints = ec2_client.describe_vpc_endpoints(
+            endpoints = describe_all(ec2_client, "describe_vpc_endpoints",
                 Filters=[{"Name": "vpc-id", "Values": [vpc_id]}]
             )
             
             endpoints_to_wait = []
+            endpoint_ids_to_delete = []
             for endpoint in endpoints["VpcEndpoints"]:
                 if endpoint["State"] not in ["deleted"]:
                     endpoints_to_wait.append(endpoint)
                     endpoint_id = endpoint["VpcEndpointId"]
-                    
+
                     if endpoint["State"] not in ["deleting"]:
-                        try:
-                            ec2_client.delete_vpc_endpoints(VpcEndpointIds=[endpoint_id])
-                            logger.info(f"    ✓ Initiated deletion of VPC endpoint: {endpoint_id}")
-                        except ClientError as endpoint_error:
-                            if endpoint_error.response["Error"]["Code"] != "InvalidVpcEndpointId.NotFound":
-                                logger.warning(f"    Could not delete VPC endpoint {endpoint_id}: {endpoint_error}")
+                        endpoint_ids_to_delete.append(endpoint_id)
                     else:
                         logger.info(f"    VPC endpoint {endpoint_id} already deleting")
-            
+
+            delete_vpc_endpoint_batch(endpoint_ids_to_delete)
+
             # Wait for VPC endpoints to be fully deleted
             if endpoints_to_wait:
                 logger.info(f"    Waiting for {len(endpoints_to_wait)} VPC endpoint(s) to be deleted...")
                 max_endpoint_wait = 300  # 5 minutes
-                endpoint_waited = 0
-                
-                while endpoint_waited < max_endpoint_wait:
-                    remaining_endpoints = []
-                    
-                    for endpoint in endpoints_to_wait:
-                        try:
-                            current_endpoints = ec2_client.describe_vpc_endpoints(
-                                VpcEndpointIds=[endpoint["VpcEndpointId"]]
-                            )
-                            if current_endpoints.get("VpcEndpoints"):
-                                current_endpoint = current_endpoints["VpcEndpoints"][0]
-                                if current_endpoint["State"] not in ["deleted"]:
-                                    remaining_endpoints.append(current_endpoint)
-                        except ClientError as e:
-                            if e.response["Error"]["Code"] == "InvalidVpcEndpointId.NotFound":
-                                logger.debug(f"      VPC endpoint {endpoint['VpcEndpointId']} confirmed deleted")
-                            else:
-                                logger.debug(f"      Error checking VPC endpoint: {e}")
-                    
-                    if not remaining_endpoints:
-                        logger.info(f"    ✓ All VPC endpoints deleted")
-                        break
-                    
-                    logger.info(f"      Still waiting for {len(remaining_endpoints)} VPC endpoint(s)... ({endpoint_waited}s/{max_endpoint_wait}s)")
-                    time.sleep(30)
-                    endpoint_waited += 30
-                
+                remaining_endpoints = wait_for_vpc_endpoints_gone(
+                    [endpoint["VpcEndpointId"] for endpoint in endpoints_to_wait],
+                    max_wait=max_endpoint_wait
+                )
+
                 if remaining_endpoints:
                     logger.warning(f"    ⚠ {len(remaining_endpoints)} VPC endpoint(s) still not deleted after {max_endpoint_wait} seconds")
                     # Continue anyway, but this might cause issues
+                else:
+                    logger.info(f"    ✓ All VPC endpoints deleted")
         except Exception as e:
             logger.info(f"    Error handling VPC endpoints: {e}")
         
         # Delete network interfaces
         try:
-            enis = ec2_client.describe_network_interfaces(
+            enis = describe_all(ec2_client, "describe_network_interfaces",
                 Filters=[{"Name": "vpc-id", "Values": [vpc_id]}]
             )
-            for eni in enis["NetworkInterfaces"]:
-                if eni["Status"] == "available":
-                    ec2_client.delete_network_interface(NetworkInterfaceId=eni["NetworkInterfaceId"])
-                    logger.info(f"    ✓ Deleted network interface: {eni['NetworkInterfaceId']}")
+
+            def delete_eni(eni_id):
+                try:
+                    ec2_client.delete_network_interface(NetworkInterfaceId=eni_id)
+                    logger.info(f"    ✓ Deleted network interface: {eni_id}")
+                except ClientError as e:
+                    if e.response["Error"]["Code"] in throttling_error_codes:
+                        raise
+                    logger.warning(f"    Could not delete network interface {eni_id}: {e}")
+
+            run_parallel(delete_eni, [
+                eni["NetworkInterfaceId"] for eni in enis["NetworkInterfaces"]
+                if eni["Status"] == "available"
+            ])
         except Exception as e:
             logger.warning(f"    Could not delete network interfaces: {e}")
         
         # Delete NAT gateways with proper route cleanup
-        nat_gws = ec2_client.describe_nat_gateways(
-            Filters=[{"Name": "vpc-id", "Values": [vpc_id]}]
+        nat_gws = describe_all(ec2_client, "describe_nat_gateways",
+            Filter=[{"Name": "vpc-id", "Values": [vpc_id]}]
         )
-        for nat_gw in nat_gws["NatGateways"]:
-            if nat_gw["State"] not in ["deleted", "deleting"]:
-                nat_gw_id = nat_gw["NatGatewayId"]
-                
-                # First, remove all routes that reference this NAT gateway
-                try:
-                    route_tables = ec2_client.describe_route_tables(
-                        Filters=[{"Name": "vpc-id", "Values": [vpc_id]}]
-                    )
-                    for rt in route_tables["RouteTables"]:
-                        routes_to_remove = []
-                        for route in rt["Routes"]:
-                            if route.get("NatGatewayId") == nat_gw_id:
-                                routes_to_remove.append(route)
-                        
-                        # Remove routes that reference this NAT gateway
-                        for route in routes_to_remove:
-                            try:
-                                ec2_client.delete_route(
-                                    RouteTableId=rt["RouteTableId"],
-                                    DestinationCidrBlock=route["DestinationCidrBlock"]
-                                )
-                                logger.info(f"    ✓ Removed route {route['DestinationCidrBlock']} -> {nat_gw_id} from route table {rt['RouteTableId']}")
-                            except ClientError as route_error:
-                                if route_error.response["Error"]["Code"] != "InvalidRoute.NotFound":
-                                    logger.warning(f"    Could not remove route from {rt['RouteTableId']}: {route_error}")
-                except Exception as route_cleanup_error:
-                    logger.warning(f"    Error cleaning up routes for NAT gateway {nat_gw_id}: {route_cleanup_error}")
-                
-                # Wait a moment for route deletion to propagate
-                time.sleep(5)
-                
-                # Now delete the NAT gateway
-                try:
-                    ec2_client.delete_nat_gateway(NatGatewayId=nat_gw_id)
-                    logger.info(f"    ✓ Deleted NAT Gateway: {nat_gw_id}")
-                except ClientError as nat_error:
-                    logger.warning(f"    Could not delete NAT gateway {nat_gw_id}: {nat_error}")
-        
-        # Wait longer for NAT gateways to be deleted
-        if nat_gws["NatGateways"]:
+        pending_nat_gw_ids = [
+            nat_gw["NatGatewayId"] for nat_gw in nat_gws["NatGateways"]
+            if nat_gw["State"] != "deleted"
+        ]
+        run_parallel(lambda nat_gw: cleanup_nat_gateway(nat_gw, rt_index), [
+            nat_gw for nat_gw in nat_gws["NatGateways"]
+            if nat_gw["State"] not in ["deleted", "deleting"]
+            and nat_gw["NatGatewayId"] not in cleaned_nat_gw_ids
+        ])
+        
+        # Wait for NAT gateways to be deleted
+        if pending_nat_gw_ids:
             logger.info("    Waiting for NAT gateways to be deleted...")
-            time.sleep(60)
-        
-        # Release Elastic IPs
-        eips = ec2_client.describe_addresses()
-        for eip in eips["Addresses"]:
-            if "NetworkInterfaceId" not in eip and "InstanceId" not in eip:
-                try:
-                    ec2_client.release_address(AllocationId=eip["AllocationId"])
-                    logger.info(f"    ✓ Released EIP: {eip['AllocationId']}")
-                except:
-                    pass
-        
+            try:
+                ec2_client.get_waiter("nat_gateway_deleted").wait(
+                    NatGatewayIds=pending_nat_gw_ids,
+                    WaiterConfig={"Delay": 5, "MaxAttempts": 60}
+                )
+            except WaiterError as e:
+                logger.warning(f"    NAT gateways not fully deleted yet: {e}")
+        
+        # Release the project's Elastic IPs: those tagged by the installer and those used by this VPC's NAT gateways
+        nat_allocation_ids = [
+            address["AllocationId"]
+            for nat_gw in nat_gws["NatGateways"]
+            for address in nat_gw.get("NatGatewayAddresses", [])
+            if address.get("AllocationId")
+        ]
+        eips = {
+            eip["AllocationId"]: eip
+            for eip in ec2_client.describe_addresses(
+                Filters=[{"Name": "tag:Name", "Values": [f"eip-{project_name}"]}]
+            )["Addresses"]
+        }
+        if nat_allocation_ids:
+            for eip in ec2_client.describe_addresses(
+                Filters=[{"Name": "allocation-id", "Values": nat_allocation_ids}]
+            )["Addresses"]:
+                eips[eip["AllocationId"]] = eip
+
+        def release_eip(allocation_id):
+            try:
+                ec2_client.release_address(AllocationId=allocation_id)
+                logger.info(f"    ✓ Released EIP: {allocation_id}")
+            except ClientError as e:
+                if e.response["Error"]["Code"] not in not_found_error_codes:
+                    logger.warning(f"    Could not release EIP {allocation_id}: {e}")
+
+        run_parallel(release_eip, [
+            allocation_id for allocation_id, eip in eips.items()
+            if "NetworkInterfaceId" not in eip and "InstanceId" not in eip
+        ])
+
         # Delete security groups with enhanced cleanup
-        sgs = ec2_client.describe_security_groups(
+        sgs = describe_all(ec2_client, "describe_security_groups",
             Filters=[{"Name": "vpc-id", "Values": [vpc_id]}]
         )
-        
-        # First, clean up all security group rules
-        for sg in sgs["SecurityGroups"]:
-            if sg["GroupName"] != "default":
-                try:
-                    # Remove all inbound rules
-                    if sg.get("IpPermissions"):
-                        ec2_client.revoke_security_group_ingress(
-                            GroupId=sg["GroupId"],
-                            IpPermissions=sg["IpPermissions"]
-                        )
-                    
-                    # Remove all outbound rules (except default)
-                    if sg.get("IpPermissionsEgress"):
-                        egress_rules = [r for r in sg["IpPermissionsEgress"] 
-                                       if not (r.get("IpProtocol") == "-1" and 
-                                              len(r.get("IpRanges", [])) == 1 and
-                                              r["IpRanges"][0].get("CidrIp") == "0.0.0.0/0")]
-                        if egress_rules:
-                            ec2_client.revoke_security_group_egress(
-                                GroupId=sg["GroupId"],
-                                IpPermissions=egress_rules
-                            )
-                except:
-                    pass
-        
-        time.sleep(10)  # Wait for rule cleanup
-        
+
+        # First, clean up all security group rules, looked up by rule ID in one paginated call
+        sg_ids = [sg["GroupId"] for sg in sgs["SecurityGroups"] if sg["GroupName"] != "default"]
+        rule_ids = {}  # (group ID, is egress) -> rule IDs
+        if sg_ids:
+            sg_rules = describe_all(ec2_client, "describe_security_group_rules",
+                Filters=[{"Name": "group-id", "Values": sg_ids}]
+            )
+            for rule in sg_rules["SecurityGroupRules"]:
+                # Keep the default allow-all egress rule
+                if (rule["IsEgress"] and rule.get("IpProtocol") == "-1"
+                        and rule.get("CidrIpv4") == "0.0.0.0/0"):
+                    continue
+                rule_ids.setdefault((rule["GroupId"], rule["IsEgress"]), []).append(rule["SecurityGroupRuleId"])
+
+        def revoke_sg_rules(key):
+            group_id, is_egress = key
+            revoke = ec2_client.revoke_security_group_egress if is_egress else ec2_client.revoke_security_group_ingress
+            try:
+                revoke(GroupId=group_id, SecurityGroupRuleIds=rule_ids[key])
+            except ClientError as e:
+                if e.response["Error"]["Code"] in throttling_error_codes:
+                    raise
+                logger.debug("    Could not revoke rules of security group %s: %s", group_id, e)
+
+        # Revocation is synchronous, so security groups can be deleted right after this
+        run_parallel(revoke_sg_rules, list(rule_ids))
+
         # Then delete security groups with retry
-        for attempt in range(3):
-            remaining_sgs = []
-            for sg in sgs["SecurityGroups"]:
-                if sg["GroupName"] != "default":
-                    try:
-                        ec2_client.delete_security_group(GroupId=sg["GroupId"])
-                        logger.info(f"    ✓ Deleted security group: {sg['GroupId']}")
-                    except ClientError as sg_error:
-                        if sg_error.response["Error"]["Code"] not in ["InvalidGroup.NotFound"]:
-                            remaining_sgs.append(sg)
-            
+        def delete_sg(sg):
+            """Returns the security group if it still needs another attempt."""
+            try:
+                ec2_client.delete_security_group(GroupId=sg["GroupId"])
+                logger.info(f"    ✓ Deleted security group: {sg['GroupId']}")
+            except ClientError as sg_error:
+                if sg_error.response["Error"]["Code"] not in ["InvalidGroup.NotFound"]:
+                    return sg
+            return None
+
+        for attempt in range(4):
+            remaining_sgs = [
+                sg for sg in run_parallel(delete_sg, [sg for sg in sgs["SecurityGroups"] if sg["GroupName"] != "default"])
+                if sg is not None
+            ]
+
             if not remaining_sgs:
                 break
-            elif attempt < 2:
-                logger.info(f"    Retrying {len(remaining_sgs)} security groups in 15 seconds...")
-                time.sleep(15)
+            elif attempt < 3:
+                wait_time = backoff_delay(attempt)
+                logger.info(f"    Retrying {len(remaining_sgs)} security groups in {wait_time:.0f} seconds...")
+                time.sleep(wait_time)
                 sgs["SecurityGroups"] = remaining_sgs
         
         # Delete subnets with retry
-        subnets = ec2_client.describe_subnets(
+        subnets = describe_all(ec2_client, "describe_subnets",
             Filters=[{"Name": "vpc-id", "Values": [vpc_id]}]
         )
-        for subnet in subnets["Subnets"]:
-            subnet_id = subnet["SubnetId"]
-            for attempt in range(3):
+
+        def delete_subnet(subnet_id):
+            for attempt in range(4):
                 try:
                     ec2_client.delete_subnet(SubnetId=subnet_id)
                     logger.info(f"    ✓ Deleted subnet: {subnet_id}")
                     break
                 except ClientError as e:
                     if e.response["Error"]["Code"] == "DependencyViolation":
-                        if attempt < 2:
-                            logger.info(f"    Retrying subnet deletion in 30s: {subnet_id}")
-                            time.sleep(30)
+                        if attempt < 3:
+                            wait_time = backoff_delay(attempt, base=30)
+                            logger.info(f"    Retrying subnet deletion in {wait_time:.0f}s: {subnet_id}")
+                            time.sleep(wait_time)
                         else:
                             logger.warning(f"    Could not delete subnet {subnet_id}: {e}")
                     else:
                         logger.warning(f"    Could not delete subnet {subnet_id}: {e}")
                         break
-        
+
+        run_parallel(delete_subnet, [subnet["SubnetId"] for subnet in subnets["Subnets"]])
+
         # Delete route tables
-        route_tables = ec2_client.describe_route_tables(
-            Filters=[{"Name": "vpc-id", "Values": [vpc_id]}]
-        )
-        for rt in route_tables["RouteTables"]:
-            if not any(assoc.get("Main") for assoc in rt["Associations"]):
-                ec2_client.delete_route_table(RouteTableId=rt["RouteTableId"])
-                logger.info(f"    ✓ Deleted route table: {rt['RouteTableId']}")
-        
+        def delete_route_table(rt_id):
+            ec2_client.delete_route_table(RouteTableId=rt_id)
+            logger.info(f"    ✓ Deleted route table: {rt_id}")
+
+        run_parallel(delete_route_table, [
+            rt_id for rt_id, rt in rt_index.items()
+            if not any(assoc.get("Main") for assoc in rt["Associations"])
+        ])
+
         # Delete internet gateway
-        igws = ec2_client.describe_internet_gateways(
+        igws = describe_all(ec2_client, "describe_internet_gateways",
             Filters=[{"Name": "attachment.vpc-id", "Values": [vpc_id]}]
         )
-        for igw in igws["InternetGateways"]:
+
+        def delete_igw(igw_id):
             ec2_client.detach_internet_gateway(
-                InternetGatewayId=igw["InternetGatewayId"],
+                InternetGatewayId=igw_id,
                 VpcId=vpc_id
             )
-            ec2_client.delete_internet_gateway(InternetGatewayId=igw["InternetGatewayId"])
-            logger.info(f"    ✓ Deleted internet gateway: {igw['InternetGatewayId']}")
-        
+            ec2_client.delete_internet_gateway(InternetGatewayId=igw_id)
+            logger.info(f"    ✓ Deleted internet gateway: {igw_id}")
+
+        run_parallel(delete_igw, [igw["InternetGatewayId"] for igw in igws["InternetGateways"]])
+
         # Delete VPC with retry and complete cleanup
         vpc_deleted = False
         for attempt in range(5):  # Increased attempts
@@ -523,22 +796,13 @@ def delete_single_vpc(vpc_id: str) -> bool:
                 # Wait and verify VPC deletion
                 logger.info(f"    Waiting for VPC {vpc_id} to be deleted...")
                 max_wait = 180  # Increased wait time to 3 minutes
-                waited = 0
-                while waited < max_wait:
-                    try:
-                        vpcs = ec2_client.describe_vpcs(VpcIds=[vpc_id])
-                        if not vpcs.get("Vpcs"):
-                            vpc_deleted = True
-                            logger.info(f"  ✓ VPC {vpc_id} successfully deleted")
-                            break
-                        time.sleep(10)  # Increased check interval
-                        waited += 10
-                    except ClientError as check_error:
-                        if check_error.response["Error"]["Code"] == "InvalidVpcID.NotFound":
-                            vpc_deleted = True
-                            logger.info(f"  ✓ VPC {vpc_id} successfully deleted")
-                            break
-                        raise
+                vpc_deleted = wait_until_gone(
+                    lambda: bool(ec2_client.describe_vpcs(VpcIds=[vpc_id]).get("Vpcs")),
+                    "InvalidVpcID.NotFound",
+                    max_wait=max_wait
+                )
+                if vpc_deleted:
+                    logger.info(f"  ✓ VPC {vpc_id} successfully deleted")
                 
                 if vpc_deleted:
                     break
@@ -547,13 +811,13 @@ def delete_single_vpc(vpc_id: str) -> bool:
                     
             except ClientError as e:
                 if e.response["Error"]["Code"] == "DependencyViolation":
-                    if attempt < 3:
+                    if attempt < 4:
                         logger.info(f"    VPC has dependencies, performing thorough cleanup (attempt {attempt + 1}/5)...")
                         
                         # More thorough dependency cleanup
                         try:
                             # Force delete any remaining network interfaces
-                            enis = ec2_client.describe_network_interfaces(
+                            enis = describe_all(ec2_client, "describe_network_interfaces",
                                 Filters=[{"Name": "vpc-id", "Values": [vpc_id]}]
                             )
                             for eni in enis["NetworkInterfaces"]:
@@ -561,11 +825,13 @@ def delete_single_vpc(vpc_id: str) -> bool:
                                     try:
                                         ec2_client.delete_network_interface(NetworkInterfaceId=eni["NetworkInterfaceId"])
                                         logger.info(f"    ✓ Force deleted network interface: {eni['NetworkInterfaceId']}")
-                                    except:
-                                        pass
+                                    except ClientError as e:
+                                        if e.response["Error"]["Code"] in throttling_error_codes:
+                                            raise
+                                        logger.debug("    Could not force delete network interface %s: %s", eni["NetworkInterfaceId"], e)
                             
                             # Delete any remaining network ACLs
-                            nacls = ec2_client.describe_network_acls(
+                            nacls = describe_all(ec2_client, "describe_network_acls",
                                 Filters=[{"Name": "vpc-id", "Values": [vpc_id]}]
                             )
                             for nacl in nacls["NetworkAcls"]:
@@ -573,12 +839,14 @@ def delete_single_vpc(vpc_id: str) -> bool:
                                     try:
                                         ec2_client.delete_network_acl(NetworkAclId=nacl["NetworkAclId"])
                                         logger.info(f"    ✓ Deleted network ACL: {nacl['NetworkAclId']}")
-                                    except:
-                                        pass
+                                    except ClientError as e:
+                                        if e.response["Error"]["Code"] in throttling_error_codes:
+                                            raise
+                                        logger.debug("    Could not delete network ACL %s: %s", nacl["NetworkAclId"], e)
                             
                             # Check for VPC peering connections
                             try:
-                                peering_connections = ec2_client.describe_vpc_peering_connections(
+                                peering_connections = describe_all(ec2_client, "describe_vpc_peering_connections",
                                     Filters=[
                                         {"Name": "requester-vpc-info.vpc-id", "Values": [vpc_id]},
                                         {"Name": "accepter-vpc-info.vpc-id", "Values": [vpc_id]}
@@ -591,10 +859,14 @@ def delete_single_vpc(vpc_id: str) -> bool:
                                                 VpcPeeringConnectionId=pc["VpcPeeringConnectionId"]
                                             )
                                             logger.info(f"    ✓ Deleted VPC peering connection: {pc['VpcPeeringConnectionId']}")
-                                        except:
-                                            pass
-                            except:
-                                pass
+                                        except ClientError as e:
+                                            if e.response["Error"]["Code"] in throttling_error_codes:
+                                                raise
+                                            logger.debug("    Could not delete VPC peering connection %s: %s", pc["VpcPeeringConnectionId"], e)
+                            except ClientError as e:
+                                if e.response["Error"]["Code"] in throttling_error_codes:
+                                    raise
+                                logger.debug("    Could not check VPC peering connections: %s", e)
                             
                             # Disassociate DHCP options
                             try:
@@ -603,15 +875,22 @@ def delete_single_vpc(vpc_id: str) -> bool:
                                     VpcId=vpc_id
                                 )
                                 logger.info(f"    ✓ Reset DHCP options to default for VPC: {vpc_id}")
-                            except:
-                                pass
+                            except ClientError as e:
+                                if e.response["Error"]["Code"] in throttling_error_codes:
+                                    raise
+                                logger.debug("    Could not reset DHCP options for VPC %s: %s", vpc_id, e)
                                 
+                        except ClientError as cleanup_error:
+                            # Let throttling reach the caller instead of retrying into it
+                            if cleanup_error.response["Error"]["Code"] in throttling_error_codes:
+                                raise
+                            logger.debug("    Error during thorough cleanup: %s", cleanup_error)
                         except Exception as cleanup_error:
-                            logger.debug(f"    Error during thorough cleanup: {cleanup_error}")
+                            logger.debug("    Error during thorough cleanup: %s", cleanup_error)
                         
-                        # Wait longer between attempts
-                        wait_time = 60 + (attempt * 30)  # Progressive wait: 60s, 90s, 120s, 150s
-                        logger.info(f"    Waiting {wait_time} seconds before retry...")
+                        # Full-jitter backoff so concurrent VPC deletions do not retry in lockstep
+                        wait_time = backoff_delay(attempt, base=60)
+                        logger.info(f"    Waiting {wait_time:.0f} seconds before retry...")
                         time.sleep(wait_time)
                     else:
                         logger.error(f"  ✗ Failed to delete VPC {vpc_id} after 5 attempts: {e}")
@@ -646,6 +925,188 @@ def delete_single_vpc(vpc_id: str) -> bool:
         logger.error(f"Error deleting VPC {vpc_id}: {e}")
         return False
 
+def main_multi(vpc_ids):
+    """Delete several VPCs in parallel.
+
+    Threads share this module's boto3 clients (which are thread-safe) and its state,
+    so NAT gateways already handled by delete_nat_gateways are skipped in every VPC.
+
+    Returns:
+        list: VPC IDs that failed to delete.
+    """
+    vpc_ids = list(vpc_ids)
+    results = run_parallel(delete_single_vpc, vpc_ids, max_workers=8)
+    return [vpc_id for vpc_id, deleted in zip(vpc_ids, results) if not deleted]
+
+def classify_vpc(vpc_id: str) -> tuple:
+    """Check whether a VPC contains project-related subnets, security groups or NAT gateways.
+
+    Returns:
+        tuple: (vpc_id, True if the VPC belongs to the project)
+    """
+    try:
+        # Each check filters server-side, so any result means the VPC belongs to the project.
+        # Checks run cheapest-first and stop at the first match.
+        name_pattern = f"*{project_name}*"
+        
+        # Check security groups
+        sgs = describe_all(ec2_client, "describe_security_groups",
+            Filters=[
+                {"Name": "vpc-id", "Values": [vpc_id]},
+                {"Name": "group-name", "Values": [name_pattern]}
+            ]
+        )
+        if sgs.get("SecurityGroups"):
+            return vpc_id, True
+        
+        # Check subnets
+        subnets = describe_all(ec2_client, "describe_subnets",
+            Filters=[
+                {"Name": "vpc-id", "Values": [vpc_id]},
+                {"Name": "tag:Name", "Values": [name_pattern]}
+            ]
+        )
+        if subnets.get("Subnets"):
+            return vpc_id, True
+        
+        # Check NAT gateways
+        nat_gws = describe_all(ec2_client, "describe_nat_gateways",
+            Filter=[
+                {"Name": "vpc-id", "Values": [vpc_id]},
+                {"Name": "tag:Name", "Values": [name_pattern]},
+                {"Name": "state", "Values": ["available", "pending", "failed"]}
+            ]
+        )
+        return vpc_id, bool(nat_gws.get("NatGateways"))
+    except Exception as e:
+        logger.debug("  Error checking VPC %s: %s", vpc_id, e)
+        return vpc_id, False
+
+@functools.lru_cache(maxsize=1)
+def project_vpc_ids() -> tuple:
+    """IDs of the VPCs carrying the project's name tag, described once and shared by every teardown step.
+
+    Call project_vpc_ids.cache_clear() before a step that must see VPCs deleted since the first lookup.
+    """
+    vpcs = describe_all(ec2_client, "describe_vpcs",
+        Filters=[{"Name": "tag:Name", "Values": [f"vpc-for-{project_name}"]}]
+    )
+    return tuple(vpc["VpcId"] for vpc in vpcs.get("Vpcs", []))
+
+@functools.lru_cache(maxsize=1)
+def project_vpc_snapshot() -> dict:
+    """Endpoints and route tables of the project VPCs, described once for the whole teardown.
+
+    Steps use the snapshot to find what to delete and only re-describe the resources they wait on.
+
+    Returns:
+        dict: "vpc_ids", "endpoints" and "route_tables" lists.
+    """
+    vpc_ids = list(project_vpc_ids())
+    snapshot = {"vpc_ids": vpc_ids, "endpoints": [], "route_tables": []}
+    if vpc_ids:
+        filters = [{"Name": "vpc-id", "Values": vpc_ids}]
+        snapshot["endpoints"] = describe_all(ec2_client, "describe_vpc_endpoints", Filters=filters)["VpcEndpoints"]
+        snapshot["route_tables"] = describe_all(ec2_client, "describe_route_tables", Filters=filters)["RouteTables"]
+    return snapshot
+
+def find_project_resources(resource_types):
+    """Find resources whose Name tag contains the project name with one paginated tagging API call.
+
+    Args:
+        resource_types: Tagging API resource type filters, e.g. ["ec2:vpc", "ec2:subnet"]
+
+    Returns:
+        dict: Resource type from the ARN (e.g. "vpc", "security-group") to a list of resource IDs.
+    """
+    resources = {}
+    paginator = tagging_client.get_paginator("get_resources")
+    for page in paginator.paginate(
+        TagFilters=[{"Key": "Name"}],
+        ResourceTypeFilters=resource_types,
+        ResourcesPerPage=100
+    ):
+        for mapping in page["ResourceTagMappingList"]:
+            # TagFilters guarantees a Name tag on every mapping
+            tags = {tag["Key"]: tag["Value"] for tag in mapping["Tags"]}
+            if project_name not in tags["Name"]:
+                continue
+            # arn:aws:ec2:<region>:<account>:vpc/vpc-0123456789abcdef0
+            resource_type, _, resource_id = mapping["ResourceARN"].split(":")[-1].partition("/")
+            resources.setdefault(resource_type, []).append(resource_id)
+    return resources
+
+def find_project_vpc_ids() -> list:
+    """Find VPCs that are named for the project or contain project subnets, security groups or NAT gateways."""
+    # Name-tagged VPCs come from the cached tag:Name describe, which is not subject to the
+    # tagging API's eventual consistency, and security groups have a server-side name filter
+    candidate_vpc_ids = set(project_vpc_ids())
+    for sg in describe_all(ec2_client, "describe_security_groups",
+        Filters=[{"Name": "group-name", "Values": [f"*{project_name}*"]}]
+    )["SecurityGroups"]:
+        candidate_vpc_ids.add(sg["VpcId"])
+    
+    # Subnets and NAT gateways can only be matched by a Name tag containing the project name
+    resources = find_project_resources(["ec2:subnet", "ec2:natgateway"])
+    
+    # ARNs do not carry the VPC ID, so resolve it with one filtered describe per resource type.
+    # Filters (rather than ID lists) skip resources the tagging API still reports after deletion.
+    if resources.get("subnet"):
+        for subnet in describe_all(ec2_client, "describe_subnets",
+            Filters=[{"Name": "subnet-id", "Values": resources["subnet"]}]
+        )["Subnets"]:
+            candidate_vpc_ids.add(subnet["VpcId"])
+    if resources.get("natgateway"):
+        for nat_gw in describe_all(ec2_client, "describe_nat_gateways",
+            Filter=[
+                {"Name": "nat-gateway-id", "Values": resources["natgateway"]},
+                {"Name": "state", "Values": ["available", "pending", "failed"]}
+            ]
+        )["NatGateways"]:
+            candidate_vpc_ids.add(nat_gw["VpcId"])
+    
+    if not candidate_vpc_ids:
+        return []
+    vpcs = describe_all(ec2_client, "describe_vpcs",
+        Filters=[{"Name": "vpc-id", "Values": list(candidate_vpc_ids)}]
+    )
+    vpc_ids = [vpc["VpcId"] for vpc in vpcs["Vpcs"]]
+    for vpc_id in vpc_ids:
+        logger.info(f"  Found project-related VPC: {vpc_id}")
+    return vpc_ids
+
+def scan_project_vpc_ids() -> list:
+    """Find project VPCs by name tag, then classify the remaining VPCs by their resources.
+
+    Used when the tagging API is unavailable.
+    """
+    # First, try to find VPCs by tag name
+    vpcs_to_delete = list(project_vpc_ids())
+    vpc_ids_found = set(vpcs_to_delete)
+    
+    # A tagged deployment is found by name, so the account-wide scan is only a fallback
+    if vpcs_to_delete:
+        return vpcs_to_delete
+    
+    # Also get all VPCs to check for any that might be related
+    all_vpcs = describe_all(ec2_client, "describe_vpcs")
+    
+    # Every VPC carrying the project name tag was found above, so only the rest need classifying
+    candidate_vpc_ids = [vpc["VpcId"] for vpc in all_vpcs.get("Vpcs", []) if vpc["VpcId"] not in vpc_ids_found]
+    
+    # Scan the remaining VPCs for project-related resources concurrently
+    if candidate_vpc_ids:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=16) as executor:
+            futures = [executor.submit(classify_vpc, vpc_id) for vpc_id in candidate_vpc_ids]
+            for future in concurrent.futures.as_completed(futures):
+                vpc_id, is_project_vpc = future.result()
+                if is_project_vpc:
+                    vpcs_to_delete.append(vpc_id)
+                    vpc_ids_found.add(vpc_id)
+                    logger.info(f"  Found project-related VPC: {vpc_id}")
+    
+    return vpcs_to_delete
+
 def delete_vpc_resources():
     """Delete VPC and related resources.
     
@@ -657,101 +1118,15 @@ def delete_vpc_resources():
     failed_vpcs = []
     
     try:
-        # Find all VPCs that might be related to the project
-        vpc_name = f"vpc-for-{project_name}"
-        
-        # First, try to find VPCs by tag name
-        vpcs_by_tag = ec2_client.describe_vpcs(
-            Filters=[{"Name": "tag:Name", "Values": [vpc_name]}]
-        )
-        
-        # Also get all VPCs to check for any that might be related
-        all_vpcs = ec2_client.describe_vpcs()
-        
-        # Collect VPCs to delete
-        vpcs_to_delete = []
-        vpc_ids_found = set()
-        
-        # Add VPCs found by tag
-        for vpc in vpcs_by_tag.get("Vpcs", []):
-            vpc_id = vpc["VpcId"]
-            if vpc_id not in vpc_ids_found:
-                vpcs_to_delete.append(vpc_id)
-                vpc_ids_found.add(vpc_id)
+        try:
+            vpcs_to_delete = find_project_vpc_ids()
+        except ClientError as e:
+            logger.debug("  Tagging API lookup failed, scanning VPCs instead: %s", e)
+            vpcs_to_delete = []
         
-        # Check all VPCs for project-related resources (subnets, security groups, etc.)
-        for vpc in all_vpcs.get("Vpcs", []):
-            vpc_id = vpc["VpcId"]
-            if vpc_id in vpc_ids_found:
-                continue
-            
-            # First, check if VPC has the correct name tag
-            vpc_has_name_tag = False
-            for tag in vpc.get("Tags", []):
-                if tag.get("Key") == "Name" and tag.get("Value") == vpc_name:
-                    vpc_has_name_tag = True
-                    vpcs_to_delete.append(vpc_id)
-                    vpc_ids_found.add(vpc_id)
-                    logger.info(f"  Found VPC by name tag: {vpc_id}")
-                    break
-            
-            # If VPC has the correct name tag, skip checking resources
-            if vpc_has_name_tag:
-                continue
-            
-            # Check if VPC has project-related resources
-            try:
-                # Check subnets
-                subnets = ec2_client.describe_subnets(
-                    Filters=[{"Name": "vpc-id", "Values": [vpc_id]}]
-                )
-                has_project_subnets = False
-                for subnet in subnets.get("Subnets", []):
-                    for tag in subnet.get("Tags", []):
-                        if project_name in tag.get("Value", ""):
-                            has_project_subnets = True
-                            break
-                    if has_project_subnets:
-                        break
-                
-                # Check security groups
-                sgs = ec2_client.describe_security_groups(
-                    Filters=[{"Name": "vpc-id", "Values": [vpc_id]}]
-                )
-                has_project_sgs = False
-                for sg in sgs.get("SecurityGroups", []):
-                    if project_name in sg.get("GroupName", ""):
-                        has_project_sgs = True
-                        break
-                
-                # Check NAT gateways
-                nat_gws = ec2_client.describe_nat_gateways(
-                    Filters=[{"Name": "vpc-id", "Values": [vpc_id]}]
-                )
-                has_project_nat = False
-                for nat_gw in nat_gws.get("NatGateways", []):
-                    if nat_gw["State"] not in ["deleted", "deleting"]:
-                        # Check tags
-                        tags_response = ec2_client.describe_tags(
-                            Filters=[
-                                {"Name": "resource-id", "Values": [nat_gw["NatGatewayId"]]},
-                                {"Name": "resource-type", "Values": ["nat-gateway"]}
-                            ]
-                        )
-                        for tag in tags_response.get("Tags", []):
-                            if project_name in tag.get("Value", ""):
-                                has_project_nat = True
-                                break
-                        if has_project_nat:
-                            break
-                
-                # If VPC has project-related resources, add it to deletion list
-                if has_project_subnets or has_project_sgs or has_project_nat:
-                    vpcs_to_delete.append(vpc_id)
-                    vpc_ids_found.add(vpc_id)
-                    logger.info(f"  Found project-related VPC: {vpc_id}")
-            except Exception as e:
-                logger.debug(f"  Error checking VPC {vpc_id}: {e}")
+        # The tagging API is eventually consistent, so an empty answer is not proof of absence
+        if not vpcs_to_delete:
+            vpcs_to_delete = scan_project_vpc_ids()
         
         if not vpcs_to_delete:
             logger.info("  No VPC found to delete")
@@ -759,47 +1134,26 @@ def delete_vpc_resources():
         
         logger.info(f"  Found {len(vpcs_to_delete)} VPC(s) to delete: {vpcs_to_delete}")
         
-        # Delete each VPC
-        for vpc_id in vpcs_to_delete:
-            if not delete_single_vpc(vpc_id):
-                failed_vpcs.append(vpc_id)
+        # Delete each VPC, on a thread pool when there are several
+        if len(vpcs_to_delete) > 1:
+            failed_vpcs.extend(main_multi(vpcs_to_delete))
+        elif not delete_single_vpc(vpcs_to_delete[0]):
+            failed_vpcs.append(vpcs_to_delete[0])
         
         # Final verification: Check if any VPCs still exist
         logger.info("  Verifying VPC deletion...")
-        remaining_vpcs = []
-        for vpc_id in vpcs_to_delete:
-            try:
-                vpcs = ec2_client.describe_vpcs(VpcIds=[vpc_id])
-                if vpcs.get("Vpcs"):
-                    remaining_vpcs.append(vpc_id)
-                    logger.warning(f"  ⚠ VPC {vpc_id} still exists")
+        # One filtered describe covers every VPC; unlike VpcIds it does not fail on already deleted ones
+        remaining_vpcs = [
+            vpc["VpcId"] for vpc in describe_all(ec2_client, "describe_vpcs",
+                Filters=[{"Name": "vpc-id", "Values": vpcs_to_delete}]
+            )["Vpcs"]
+        ]
+        for vpc_id in set(vpcs_to_delete) - set(remaining_vpcs):
+            logger.debug("  ✓ VPC %s confirmed deleted", vpc_id)
 
-                    # retry VPC deletion
-                    for attempt in range(3):
-                        try:
-                            ec2_client.delete_vpc(VpcId=vpc_id)
-                            logger.info(f"  ✓ VPC deletion initiated: {vpc_id}")
-                            break
-                        except ClientError as e:
-                            if e.response["Error"]["Code"] == "DependencyViolation":
-                                if attempt < 2:
-                                    logger.info(f"    Retrying VPC deletion in 30s: {vpc_id}")
-                                    time.sleep(30)
-                                else:
-                                    logger.warning(f"    Could not delete VPC {vpc_id}: {e}")
-                                    break
-                            else:
-                                logger.warning(f"    Could not delete VPC {vpc_id}: {e}")
-                                break
-            except ClientError as e:
-                if e.response["Error"]["Code"] == "InvalidVpcID.NotFound":
-                    logger.debug(f"  ✓ VPC {vpc_id} confirmed deleted")
-                else:
-                    logger.warning(f"  Could not verify VPC {vpc_id}: {e}")
-        
         if remaining_vpcs:
-            logger.error(f"  ✗ {len(remaining_vpcs)} VPC(s) still exist: {remaining_vpcs}")
-            logger.error("  Please check AWS console and delete manually if needed")
+            # delete_single_vpc already retried; main() retries these once more after CloudFront cleanup
+            logger.warning(f"  ⚠ {len(remaining_vpcs)} VPC(s) still exist: {remaining_vpcs}")
             # Add remaining VPCs to failed list
             for vpc_id in remaining_vpcs:
                 if vpc_id not in failed_vpcs:
@@ -809,7 +1163,29 @@ def delete_vpc_resources():
     except Exception as e:
         logger.error(f"Error deleting VPC resources: {e}")
     
-    return failed_vpcs
+    return failed_vpcs
+
+def find_collection_id(collection_name: str):
+    """Look up an OpenSearch Serverless collection ID by name.
+
+    Returns:
+        str: Collection ID, or None if no collection has that name.
+    """
+    # batch_get_collection resolves the name directly, with a constant-size response
+    try:
+        details = opensearch_client.batch_get_collection(names=[collection_name]).get("collectionDetails", [])
+        return details[0]["id"] if details else None
+    except ClientError as e:
+        if e.response["Error"]["Code"] in throttling_error_codes:
+            raise
+        logger.debug("    batch_get_collection failed, listing collections instead: %s", e)
+    
+    # The name filter matches exactly, so a single page holds the collection if it exists
+    collections = opensearch_client.list_collections(collectionFilters={"name": collection_name})
+    for collection in collections.get("collectionSummaries", []):
+        if collection["name"] == collection_name:
+            return collection["id"]
+    return None
 
 def delete_opensearch_collection():
     """Delete OpenSearch Serverless collection and policies."""
@@ -820,25 +1196,28 @@ def delete_opensearch_collection():
         
         # Get collection ID first
         try:
-            collections = opensearch_client.list_collections()
-            collection_id = None
-            for collection in collections.get("collectionSummaries", []):
-                if collection["name"] == collection_name:
-                    collection_id = collection["id"]
-                    break
+            collection_id = find_collection_id(collection_name)
             
             if collection_id:
                 # Delete collection using ID
                 opensearch_client.delete_collection(id=collection_id)
                 logger.info(f"  ✓ Deleted collection: {collection_name} (ID: {collection_id})")
                 
-                # Wait for deletion
-                time.sleep(30)
+                # Wait for deletion, returning as soon as the collection is gone
+                if wait_until_gone(
+                    lambda: bool(opensearch_client.batch_get_collection(ids=[collection_id]).get("collectionDetails")),
+                    "ResourceNotFoundException",
+                    max_wait=120,
+                    max_delay=3
+                ):
+                    logger.debug("    Collection deletion confirmed")
+                else:
+                    logger.warning(f"  Collection {collection_name} still deleting after 120 seconds")
             else:
                 logger.info(f"  Collection {collection_name} not found")
                 
         except ClientError as e:
-            if e.response["Error"]["Code"] != "ResourceNotFoundException":
+            if e.response["Error"]["Code"] not in not_found_error_codes:
                 logger.warning(f"  Could not delete collection: {e}")
         
         # Delete data access policy (different API)
@@ -849,7 +1228,7 @@ def delete_opensearch_collection():
             )
             logger.info(f"  ✓ Deleted data access policy: data-{project_name}")
         except ClientError as e:
-            if e.response["Error"]["Code"] != "ResourceNotFoundException":
+            if e.response["Error"]["Code"] not in not_found_error_codes:
                 logger.warning(f"  Could not delete data access policy: {e}")
         
         # Delete policies
@@ -866,7 +1245,7 @@ def delete_opensearch_collection():
                 )
                 logger.info(f"  ✓ Deleted {policy_type} policy: {policy_name}")
             except ClientError as e:
-                if e.response["Error"]["Code"] != "ResourceNotFoundException":
+                if e.response["Error"]["Code"] not in not_found_error_codes:
                     logger.warning(f"  Could not delete {policy_type} policy {policy_name}: {e}")
         
         logger.info("✓ OpenSearch collection deleted")
@@ -879,78 +1258,72 @@ def delete_knowledge_bases():
     
     try:
         # List all knowledge bases
-        try:
-            kb_list = bedrock_agent_client.list_knowledge_bases()
-            knowledge_bases = kb_list.get("knowledgeBaseSummaries", [])
-            
-            # Find knowledge bases matching project name
-            kb_to_delete = []
-            for kb in knowledge_bases:
-                if kb["name"] == project_name:
-                    kb_to_delete.append(kb["knowledgeBaseId"])
-                    logger.info(f"  Knowledge Base found: {kb['knowledgeBaseId']}")
-                                
-            if not kb_to_delete:
-                logger.info(f"  No Knowledge Base found with name: {project_name}")
-                return
-            
-            # Delete each knowledge base
-            for kb_id in kb_to_delete:
-                try:
-                    logger.info(f"  Deleting Knowledge Base: {kb_id}")
-                    
-                    # Delete all data sources first
-                    try:
-                        data_sources = bedrock_agent_client.list_data_sources(
-                            knowledgeBaseId=kb_id,
-                            maxResults=100
-                        )
-                        for ds in data_sources.get("dataSourceSummaries", []):
-                            try:
-                                bedrock_agent_client.delete_data_source(
-                                    knowledgeBaseId=kb_id,
-                                    dataSourceId=ds["dataSourceId"]
-                                )
-                                logger.info(f"    ✓ Deleted data source: {ds['dataSourceId']}")
-                            except Exception as e:
-                                logger.warning(f"    Could not delete data source {ds['dataSourceId']}: {e}")
-                    except Exception as e:
-                        logger.debug(f"    Error listing/deleting data sources: {e}")
-                    
-                    # Delete the knowledge base
-                    bedrock_agent_client.delete_knowledge_base(knowledgeBaseId=kb_id)
-                    logger.info(f"  ✓ Deleted Knowledge Base: {kb_id}")
-                    
-                    # Wait for deletion to complete
-                    logger.debug("    Waiting for Knowledge Base deletion to complete...")
-                    max_wait = 60  # Wait up to 60 seconds
-                    waited = 0
-                    while waited < max_wait:
-                        try:
-                            kb_response = bedrock_agent_client.get_knowledge_base(knowledgeBaseId=kb_id)
-                            status = kb_response["knowledgeBase"]["status"]
-                            if status == "DELETED":
-                                break
-                            time.sleep(5)
-                            waited += 5
-                        except ClientError as e:
-                            if e.response["Error"]["Code"] == "ResourceNotFoundException":
-                                logger.debug("    Knowledge Base deletion confirmed")
-                                break
-                            raise
-                    
-                except ClientError as e:
-                    if e.response["Error"]["Code"] == "ResourceNotFoundException":
-                        logger.debug(f"  Knowledge Base {kb_id} already deleted")
-                    else:
-                        logger.warning(f"  Could not delete Knowledge Base {kb_id}: {e}")
-                except Exception as e:
-                    logger.warning(f"  Error deleting Knowledge Base {kb_id}: {e}")
-            
-            logger.info("✓ Knowledge Bases deleted")
-        except Exception as e:
-            logger.warning(f"  Could not list Knowledge Bases: {e}")
-            
+        kb_list = describe_all(bedrock_agent_client, "list_knowledge_bases")
+        knowledge_bases = kb_list.get("knowledgeBaseSummaries", [])
+        
+        # Find knowledge bases matching project name
+        kb_to_delete = []
+        for kb in knowledge_bases:
+            if kb["name"] == project_name:
+                kb_to_delete.append(kb["knowledgeBaseId"])
+                logger.info(f"  Knowledge Base found: {kb['knowledgeBaseId']}")
+                            
+        if not kb_to_delete:
+            logger.info(f"  No Knowledge Base found with name: {project_name}")
+            return
+        
+        # Delete every data source across all knowledge bases in one flat batch
+        def list_data_sources(kb_id):
+            try:
+                data_sources = describe_all(bedrock_agent_client, "list_data_sources",
+                    knowledgeBaseId=kb_id
+                )
+                return [(kb_id, ds["dataSourceId"]) for ds in data_sources.get("dataSourceSummaries", [])]
+            except Exception as e:
+                logger.debug("    Error listing data sources for %s: %s", kb_id, e)
+                return []
+
+        def delete_data_source(data_source):
+            kb_id, ds_id = data_source
+            try:
+                bedrock_agent_client.delete_data_source(
+                    knowledgeBaseId=kb_id,
+                    dataSourceId=ds_id
+                )
+                logger.info(f"    ✓ Deleted data source: {ds_id}")
+            except Exception as e:
+                logger.warning(f"    Could not delete data source {ds_id}: {e}")
+
+        data_sources = [ds for kb_sources in run_parallel(list_data_sources, kb_to_delete) for ds in kb_sources]
+        run_parallel(delete_data_source, data_sources)
+        
+        # Delete the knowledge bases concurrently, each polling for its own confirmation
+        def delete_knowledge_base(kb_id):
+            try:
+                bedrock_agent_client.delete_knowledge_base(knowledgeBaseId=kb_id)
+                logger.info(f"  ✓ Deleted Knowledge Base: {kb_id}")
+                
+                # Wait for deletion to complete
+                logger.debug("    Waiting for Knowledge Base deletion to complete...")
+                if wait_until_gone(
+                    lambda: bedrock_agent_client.get_knowledge_base(knowledgeBaseId=kb_id)["knowledgeBase"]["status"] != "DELETED",
+                    "ResourceNotFoundException",
+                    max_wait=60,
+                    max_delay=8
+                ):
+                    logger.debug("    Knowledge Base deletion confirmed")
+                
+            except ClientError as e:
+                if e.response["Error"]["Code"] == "ResourceNotFoundException":
+                    logger.debug("  Knowledge Base %s already deleted", kb_id)
+                else:
+                    logger.warning(f"  Could not delete Knowledge Base {kb_id}: {e}")
+            except Exception as e:
+                logger.warning(f"  Error deleting Knowledge Base {kb_id}: {e}")
+
+        run_parallel(delete_knowledge_base, kb_to_delete)
+        
+        logger.info("✓ Knowledge Bases deleted")
     except Exception as e:
         logger.error(f"Error deleting Knowledge Bases: {e}")
 
@@ -959,93 +1332,53 @@ def delete_code_interpreters():
     logger.info("[5.6/9] Deleting Code Interpreters")
     
     try:
-        # List all code interpreters
-        try:
-            # Try to list code interpreters
-            # Note: If list API doesn't exist, we'll try to delete by name
+        # Only customer-created code interpreters can be deleted; the AWS-managed one is skipped
+        code_interpreters = describe_all(bedrock_agentcore_client, "list_code_interpreters",
+            type="CUSTOMER"
+        ).get("codeInterpreterSummaries", [])
+        
+        # Code interpreter names cannot contain hyphens, so match the underscore form as well
+        name_patterns = {project_name, project_name.replace("-", "_")}
+        ci_to_delete = []
+        for ci in code_interpreters:
+            if ci.get("status") in ["DELETING", "DELETED"]:
+                continue
+            if any(pattern in ci.get("name", "") for pattern in name_patterns):
+                ci_to_delete.append(ci["codeInterpreterId"])
+                logger.info(f"  Code Interpreter found: {ci['codeInterpreterId']}")
+        
+        if not ci_to_delete:
+            logger.info(f"  No Code Interpreter found to delete")
+            return
+        
+        # Delete each code interpreter
+        for ci_id in ci_to_delete:
             try:
-                response = bedrock_agentcore_client.list_code_interpreters()
-                code_interpreters = response.get("codeInterpreters", [])
+                logger.info(f"  Deleting Code Interpreter: {ci_id}")
+                bedrock_agentcore_client.delete_code_interpreter(
+                    codeInterpreterId=ci_id
+                )
+                logger.info(f"  ✓ Deleted Code Interpreter: {ci_id}")
+                
+                # Wait for deletion to complete
+                logger.debug("    Waiting for Code Interpreter deletion to complete...")
+                if wait_until_gone(
+                    lambda: bedrock_agentcore_client.get_code_interpreter(codeInterpreterId=ci_id).get("status", "") != "DELETED",
+                    "ResourceNotFoundException",
+                    max_wait=60,
+                    max_delay=8
+                ):
+                    logger.debug("    Code Interpreter deletion confirmed")
+                
             except ClientError as e:
-                # If list API doesn't exist, try to describe by name
-                if e.response["Error"]["Code"] == "InvalidRequestException" or "not found" in str(e).lower():
-                    logger.debug("  List API not available, trying to delete by name")
-                    code_interpreters = []
+                if e.response["Error"]["Code"] == "ResourceNotFoundException":
+                    logger.debug("  Code Interpreter %s already deleted", ci_id)
                 else:
-                    raise
-            
-            # Find code interpreters matching project name
-            ci_to_delete = []
-            for ci in code_interpreters:
-                if ci.get("name") == project_name or project_name in ci.get("name", ""):
-                    ci_id = ci.get("codeInterpreterId") or ci.get("id")
-                    if ci_id:
-                        ci_to_delete.append(ci_id)
-                        logger.info(f"  Code Interpreter found: {ci_id}")
-            
-            # If no code interpreters found in list, try to delete by name directly
-            if not ci_to_delete:
-                logger.info(f"  Trying to delete code interpreter by name: {project_name}")
-                try:
-                    # Try to describe code interpreter by name
-                    response = bedrock_agentcore_client.describe_code_interpreter(
-                        codeInterpreterId=project_name
-                    )
-                    ci_id = response.get("codeInterpreterId") or response.get("id")
-                    if ci_id:
-                        ci_to_delete.append(ci_id)
-                        logger.info(f"  Code Interpreter found: {ci_id}")
-                except ClientError as e:
-                    if e.response["Error"]["Code"] == "ResourceNotFoundException":
-                        logger.info(f"  No Code Interpreter found with name: {project_name}")
-                    else:
-                        logger.warning(f"  Could not describe code interpreter: {e}")
-            
-            if not ci_to_delete:
-                logger.info(f"  No Code Interpreter found to delete")
-                return
-            
-            # Delete each code interpreter
-            for ci_id in ci_to_delete:
-                try:
-                    logger.info(f"  Deleting Code Interpreter: {ci_id}")
-                    bedrock_agentcore_client.delete_code_interpreter(
-                        codeInterpreterId=ci_id
-                    )
-                    logger.info(f"  ✓ Deleted Code Interpreter: {ci_id}")
-                    
-                    # Wait for deletion to complete
-                    logger.debug("    Waiting for Code Interpreter deletion to complete...")
-                    max_wait = 60  # Wait up to 60 seconds
-                    waited = 0
-                    while waited < max_wait:
-                        try:
-                            response = bedrock_agentcore_client.describe_code_interpreter(
-                                codeInterpreterId=ci_id
-                            )
-                            status = response.get("status", "")
-                            if status == "DELETED":
-                                break
-                            time.sleep(5)
-                            waited += 5
-                        except ClientError as e:
-                            if e.response["Error"]["Code"] == "ResourceNotFoundException":
-                                logger.debug("    Code Interpreter deletion confirmed")
-                                break
-                            raise
-                    
-                except ClientError as e:
-                    if e.response["Error"]["Code"] == "ResourceNotFoundException":
-                        logger.debug(f"  Code Interpreter {ci_id} already deleted")
-                    else:
-                        logger.warning(f"  Could not delete Code Interpreter {ci_id}: {e}")
-                except Exception as e:
-                    logger.warning(f"  Error deleting Code Interpreter {ci_id}: {e}")
-            
-            logger.info("✓ Code Interpreters deleted")
-        except Exception as e:
-            logger.warning(f"  Could not list Code Interpreters: {e}")
-            
+                    logger.warning(f"  Could not delete Code Interpreter {ci_id}: {e}")
+            except Exception as e:
+                logger.warning(f"  Error deleting Code Interpreter {ci_id}: {e}")
+        
+        logger.info("✓ Code Interpreters deleted")
     except Exception as e:
         logger.error(f"Error deleting Code Interpreters: {e}")
 
@@ -1059,7 +1392,7 @@ def delete_secrets():
         f"tavilyapikey-{project_name}"
     ]
     
-    for secret_name in secret_names:
+    def delete_secret(secret_name):
         try:
             secrets_client.delete_secret(
                 SecretId=secret_name,
@@ -1067,9 +1400,11 @@ def delete_secrets():
             )
             logger.info(f"  ✓ Deleted secret: {secret_name}")
         except ClientError as e:
-            if e.response["Error"]["Code"] != "ResourceNotFoundException":
+            if e.response["Error"]["Code"] not in not_found_error_codes:
                 logger.warning(f"  Could not delete secret {secret_name}: {e}")
     
+    run_parallel(delete_secret, secret_names)
+    
     logger.info("✓ Secrets deleted")
 
 def delete_security_groups():
@@ -1077,8 +1412,10 @@ def delete_security_groups():
     logger.info("[4/9] Deleting security groups")
     
     try:
-        # Get all security groups
-        all_sgs = ec2_client.describe_security_groups()
+        # Get security groups whose name contains the project name, filtered server-side
+        all_sgs = describe_all(ec2_client, "describe_security_groups",
+            Filters=[{"Name": "group-name", "Values": [f"*{project_name}*"]}]
+        )
         
         # Find security groups matching project name pattern
         sgs_to_delete = []
@@ -1112,12 +1449,19 @@ def cleanup_security_group_dependencies(sgs_to_delete):
     """Clean up security group rules and dependencies."""
     sg_ids_to_delete = {sg["GroupId"] for sg in sgs_to_delete}
     
+    # Describe all groups to be deleted in one call; a group-id filter skips already deleted groups without failing
+    sg_details = {
+        sg["GroupId"]: sg
+        for sg in describe_all(ec2_client, "describe_security_groups",
+            Filters=[{"Name": "group-id", "Values": list(sg_ids_to_delete)}]
+        )["SecurityGroups"]
+    }
+    
     # First pass: Remove all rules from security groups to be deleted
-    for sg_info in sgs_to_delete:
+    def strip_rules(sg_info):
         try:
-            sg_detail = ec2_client.describe_security_groups(GroupIds=[sg_info["GroupId"]])
-            if sg_detail.get("SecurityGroups"):
-                sg = sg_detail["SecurityGroups"][0]
+            if sg_info["GroupId"] in sg_details:
+                sg = sg_details[sg_info["GroupId"]]
                 
                 # Remove all inbound rules
                 if sg.get("IpPermissions"):
@@ -1128,8 +1472,8 @@ def cleanup_security_group_dependencies(sgs_to_delete):
                         )
                         logger.info(f"  ✓ Removed inbound rules from: {sg_info['GroupName']}")
                     except ClientError as e:
-                        if e.response.get("Error", {}).get("Code") != "InvalidPermission.NotFound":
-                            logger.debug(f"    Could not remove inbound rules: {e}")
+                        if e.response.get("Error", {}).get("Code") not in not_found_error_codes:
+                            logger.debug("    Could not remove inbound rules: %s", e)
                 
                 # Remove all outbound rules (except default allow-all)
                 if sg.get("IpPermissionsEgress"):
@@ -1149,19 +1493,27 @@ def cleanup_security_group_dependencies(sgs_to_delete):
                             )
                             logger.info(f"  ✓ Removed outbound rules from: {sg_info['GroupName']}")
                         except ClientError as e:
-                            if e.response.get("Error", {}).get("Code") != "InvalidPermission.NotFound":
-                                logger.debug(f"    Could not remove outbound rules: {e}")
+                            if e.response.get("Error", {}).get("Code") not in not_found_error_codes:
+                                logger.debug("    Could not remove outbound rules: %s", e)
         except ClientError as e:
-            if e.response.get("Error", {}).get("Code") != "InvalidGroup.NotFound":
-                logger.debug(f"    Could not process security group {sg_info['GroupName']}: {e}")
+            if e.response.get("Error", {}).get("Code") not in not_found_error_codes:
+                logger.debug("    Could not process security group %s: %s", sg_info["GroupName"], e)
+
+    run_parallel(strip_rules, sgs_to_delete, max_workers=8)
     
     time.sleep(5)
     
-    # Second pass: Remove references from other security groups
-    all_sgs_again = ec2_client.describe_security_groups()
-    for sg in all_sgs_again.get("SecurityGroups", []):
+    # Second pass: Remove references from other security groups, fetching only the groups whose rules reference ours
+    referencing_sgs = {}
+    for filter_name in ["ip-permission.group-id", "egress.ip-permission.group-id"]:
+        for sg in describe_all(ec2_client, "describe_security_groups",
+            Filters=[{"Name": filter_name, "Values": list(sg_ids_to_delete)}]
+        )["SecurityGroups"]:
+            referencing_sgs[sg["GroupId"]] = sg
+    
+    def remove_references(sg):
         if sg["GroupId"] in sg_ids_to_delete:
-            continue
+            return
         
         # Check and remove inbound rules that reference our security groups
         inbound_to_remove = []
@@ -1180,7 +1532,7 @@ def cleanup_security_group_dependencies(sgs_to_delete):
                 )
                 logger.info(f"  ✓ Removed references from security group: {sg.get('GroupName', sg['GroupId'])}")
             except ClientError as e:
-                logger.debug(f"    Could not remove inbound references: {e}")
+                logger.debug("    Could not remove inbound references: %s", e)
         
         # Check and remove outbound rules that reference our security groups
         outbound_to_remove = []
@@ -1199,7 +1551,9 @@ def cleanup_security_group_dependencies(sgs_to_delete):
                 )
                 logger.info(f"  ✓ Removed outbound references from security group: {sg.get('GroupName', sg['GroupId'])}")
             except ClientError as e:
-                logger.debug(f"    Could not remove outbound references: {e}")
+                logger.debug("    Could not remove outbound references: %s", e)
+
+    run_parallel(remove_references, list(referencing_sgs.values()), max_workers=8)
     
     time.sleep(5)
 
@@ -1208,48 +1562,79 @@ def delete_security_groups_with_retry(sgs_to_delete):
     deleted_sgs = []
     remaining_sgs = sgs_to_delete.copy()
     
-    for attempt in range(5):  # Increased attempts
+    # Index attached network interfaces with one describe per retry round instead of one per group
+    enis_by_sg = {}
+
+    def index_enis(filters):
+        try:
+            enis = describe_all(ec2_client, "describe_network_interfaces", Filters=filters)
+        except ClientError as e:
+            if e.response["Error"]["Code"] in throttling_error_codes:
+                raise
+            logger.debug("    Could not check network interfaces: %s", e)
+            return
+        enis_by_sg.clear()
+        for eni in enis["NetworkInterfaces"]:
+            for group in eni.get("Groups", []):
+                enis_by_sg.setdefault(group["GroupId"], []).append(eni)
+
+    index_enis([{"Name": "group-id", "Values": [sg["GroupId"] for sg in sgs_to_delete]}])
+    
+    def try_delete(sg_info):
+        """Returns True once the security group is gone."""
+        try:
+            ec2_client.delete_security_group(GroupId=sg_info["GroupId"])
+            logger.info(f"  ✓ Deleted security group: {sg_info['GroupName']} ({sg_info['GroupId']})")
+            return True
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "")
+            if error_code == "DependencyViolation":
+                enis = enis_by_sg.get(sg_info["GroupId"], [])
+                if enis:
+                    logger.debug("    Security group %s attached to %s network interface(s)", sg_info["GroupName"], len(enis))
+                # Try to delete available network interfaces; each is removed from the index once handled
+                for eni in enis[:]:
+                    if eni.get("InterfaceType") in managed_eni_types:
+                        logger.debug("    Skipping %s network interface %s, released by its owning service", eni["InterfaceType"], eni["NetworkInterfaceId"])
+                        enis.remove(eni)
+                    elif eni["Status"] == "available":
+                        try:
+                            ec2_client.delete_network_interface(NetworkInterfaceId=eni["NetworkInterfaceId"])
+                            logger.info(f"    ✓ Deleted network interface: {eni['NetworkInterfaceId']}")
+                            enis.remove(eni)
+                        except ClientError as e:
+                            if e.response["Error"]["Code"] in throttling_error_codes:
+                                raise
+                            logger.debug("    Could not delete network interface %s: %s", eni["NetworkInterfaceId"], e)
+            elif error_code == "InvalidGroup.NotFound":
+                logger.debug("  Security group %s already deleted", sg_info["GroupName"])
+                return True
+            else:
+                logger.debug("    Could not delete security group %s: %s", sg_info["GroupName"], e)
+        return False
+
+    for attempt in range(6):  # Increased attempts
         if not remaining_sgs:
             break
         
-        logger.info(f"  Attempt {attempt + 1}/5: Trying to delete {len(remaining_sgs)} security group(s)")
+        logger.info(f"  Attempt {attempt + 1}/6: Trying to delete {len(remaining_sgs)} security group(s)")
         
-        for sg_info in remaining_sgs[:]:
-            try:
-                ec2_client.delete_security_group(GroupId=sg_info["GroupId"])
-                logger.info(f"  ✓ Deleted security group: {sg_info['GroupName']} ({sg_info['GroupId']})")
+        # Refresh the indexed interfaces so ones released since the last round are seen as available.
+        # A network-interface-id filter, unlike NetworkInterfaceIds, does not fail on deleted interfaces.
+        eni_ids = {eni["NetworkInterfaceId"] for enis in enis_by_sg.values() for eni in enis}
+        if attempt > 0 and eni_ids:
+            index_enis([{"Name": "network-interface-id", "Values": list(eni_ids)}])
+        
+        # Deletions and the per-group ENI probes are independent, so run them concurrently
+        attempt_sgs = remaining_sgs[:]
+        for sg_info, deleted in zip(attempt_sgs, run_parallel(try_delete, attempt_sgs)):
+            if deleted:
                 deleted_sgs.append(sg_info)
                 remaining_sgs.remove(sg_info)
-            except ClientError as e:
-                error_code = e.response.get("Error", {}).get("Code", "")
-                if error_code == "DependencyViolation":
-                    # Check network interfaces
-                    try:
-                        enis = ec2_client.describe_network_interfaces(
-                            Filters=[{"Name": "group-id", "Values": [sg_info["GroupId"]]}]
-                        )
-                        if enis.get("NetworkInterfaces"):
-                            logger.debug(f"    Security group {sg_info['GroupName']} attached to {len(enis['NetworkInterfaces'])} network interface(s)")
-                            # Try to detach from available network interfaces
-                            for eni in enis["NetworkInterfaces"]:
-                                if eni["Status"] == "available":
-                                    try:
-                                        ec2_client.delete_network_interface(NetworkInterfaceId=eni["NetworkInterfaceId"])
-                                        logger.info(f"    ✓ Deleted network interface: {eni['NetworkInterfaceId']}")
-                                    except:
-                                        pass
-                    except:
-                        pass
-                elif error_code == "InvalidGroup.NotFound":
-                    logger.debug(f"  Security group {sg_info['GroupName']} already deleted")
-                    deleted_sgs.append(sg_info)
-                    remaining_sgs.remove(sg_info)
-                else:
-                    logger.debug(f"    Could not delete security group {sg_info['GroupName']}: {e}")
         
-        if remaining_sgs and attempt < 4:
-            wait_time = 15 + (attempt * 10)  # Progressive wait
-            logger.info(f"  Waiting {wait_time} seconds before retry...")
+        if remaining_sgs and attempt < 5:
+            wait_time = backoff_delay(attempt)
+            logger.info(f"  Waiting {wait_time:.0f} seconds before retry...")
             time.sleep(wait_time)
     
     if remaining_sgs:
@@ -1263,45 +1648,41 @@ def delete_route_tables():
     logger.info("  Deleting route tables...")
     
     try:
-        # Get all route tables for project VPCs
-        vpc_name = f"vpc-for-{project_name}"
-        vpcs = ec2_client.describe_vpcs(
-            Filters=[{"Name": "tag:Name", "Values": [vpc_name]}]
-        )
-        
-        for vpc in vpcs.get("Vpcs", []):
-            vpc_id = vpc["VpcId"]
-            route_tables = ec2_client.describe_route_tables(
-                Filters=[{"Name": "vpc-id", "Values": [vpc_id]}]
-            )
+        # Route tables of every project VPC, from the shared snapshot
+        for rt in project_vpc_snapshot()["route_tables"]:
+            # The main route table is removed along with its VPC
+            if any(assoc.get("Main") for assoc in rt["Associations"]):
+                continue
+            rt_id = rt["RouteTableId"]
+            vpc_id = rt["VpcId"]
             
-            for rt in route_tables["RouteTables"]:
-                if not any(assoc.get("Main") for assoc in rt["Associations"]):
-                    rt_id = rt["RouteTableId"]
-                    
-                    # Disassociate from subnets
-                    for assoc in rt["Associations"]:
-                        if not assoc.get("Main") and "SubnetId" in assoc:
-                            try:
-                                ec2_client.disassociate_route_table(
-                                    AssociationId=assoc["RouteTableAssociationId"]
-                                )
-                                logger.info(f"    ✓ Disassociated route table {rt_id} from subnet {assoc['SubnetId']}")
-                            except ClientError as e:
-                                if e.response["Error"]["Code"] != "InvalidAssociationID.NotFound":
-                                    logger.debug(f"    Could not disassociate route table {rt_id}: {e}")
-                    
-                    time.sleep(2)
-                    
-                    # Delete the route table
+            # Disassociate from subnets
+            for assoc in rt["Associations"]:
+                if "SubnetId" in assoc:
                     try:
-                        ec2_client.delete_route_table(RouteTableId=rt_id)
-                        logger.info(f"  ✓ Deleted route table: {rt_id} (VPC: {vpc_id})")
+                        ec2_client.disassociate_route_table(
+                            AssociationId=assoc["RouteTableAssociationId"]
+                        )
+                        logger.info(f"    ✓ Disassociated route table {rt_id} from subnet {assoc['SubnetId']}")
                     except ClientError as e:
-                        if e.response["Error"]["Code"] != "InvalidRouteTableID.NotFound":
-                            logger.debug(f"  Could not delete route table {rt_id}: {e}")
+                        if e.response["Error"]["Code"] not in not_found_error_codes:
+                            logger.debug("    Could not disassociate route table %s: %s", rt_id, e)
+            
+            # Delete the route table right away, backing off only while the disassociation settles
+            for attempt in range(4):
+                try:
+                    ec2_client.delete_route_table(RouteTableId=rt_id)
+                    logger.info(f"  ✓ Deleted route table: {rt_id} (VPC: {vpc_id})")
+                    break
+                except ClientError as e:
+                    if e.response["Error"]["Code"] == "DependencyViolation" and attempt < 3:
+                        time.sleep(backoff_delay(attempt, base=2, cap=10))
+                        continue
+                    if e.response["Error"]["Code"] not in not_found_error_codes:
+                        logger.debug("  Could not delete route table %s: %s", rt_id, e)
+                    break
     except Exception as e:
-        logger.debug(f"Error deleting route tables: {e}")
+        logger.debug("Error deleting route tables: %s", e)
 
 def delete_vpc_endpoints_and_wait():
     """Delete VPC endpoints and wait for completion."""
@@ -1309,73 +1690,44 @@ def delete_vpc_endpoints_and_wait():
     
     try:
         # Find all VPC endpoints for project VPCs
-        vpc_name = f"vpc-for-{project_name}"
-        vpcs = ec2_client.describe_vpcs(
-            Filters=[{"Name": "tag:Name", "Values": [vpc_name]}]
-        )
+        snapshot = project_vpc_snapshot()
+        if not snapshot["vpc_ids"]:
+            logger.info("  No project VPCs found")
+            return
         
         all_endpoints = []
-        for vpc in vpcs.get("Vpcs", []):
-            vpc_id = vpc["VpcId"]
-            endpoints = ec2_client.describe_vpc_endpoints(
-                Filters=[{"Name": "vpc-id", "Values": [vpc_id]}]
-            )
-            
-            for endpoint in endpoints["VpcEndpoints"]:
-                if endpoint["State"] not in ["deleted", "deleting"]:
-                    all_endpoints.append(endpoint)
-                    logger.info(f"  Found VPC endpoint to delete: {endpoint['VpcEndpointId']} ({endpoint.get('ServiceName', 'Unknown')})")
-                elif endpoint["State"] == "deleting":
-                    all_endpoints.append(endpoint)
-                    logger.info(f"  Found VPC endpoint already deleting: {endpoint['VpcEndpointId']} ({endpoint.get('ServiceName', 'Unknown')})")
+        for endpoint in snapshot["endpoints"]:
+            if endpoint["State"] not in ["deleted", "deleting"]:
+                all_endpoints.append(endpoint)
+                logger.info(f"  Found VPC endpoint to delete: {endpoint['VpcEndpointId']} ({endpoint.get('ServiceName', 'Unknown')})")
+            elif endpoint["State"] == "deleting":
+                all_endpoints.append(endpoint)
+                logger.info(f"  Found VPC endpoint already deleting: {endpoint['VpcEndpointId']} ({endpoint.get('ServiceName', 'Unknown')})")
+        
+        if not all_endpoints:
+            logger.info("  No VPC endpoints found to delete")
+            return
         
         # Delete endpoints that are not already deleting
-        for endpoint in all_endpoints:
-            if endpoint["State"] not in ["deleted", "deleting"]:
-                try:
-                    ec2_client.delete_vpc_endpoints(VpcEndpointIds=[endpoint["VpcEndpointId"]])
-                    logger.info(f"  ✓ Initiated deletion of VPC endpoint: {endpoint['VpcEndpointId']}")
-                except ClientError as e:
-                    if e.response["Error"]["Code"] != "InvalidVpcEndpointId.NotFound":
-                        logger.warning(f"  Could not delete VPC endpoint {endpoint['VpcEndpointId']}: {e}")
+        delete_vpc_endpoint_batch([
+            endpoint["VpcEndpointId"] for endpoint in all_endpoints
+            if endpoint["State"] not in ["deleted", "deleting"]
+        ])
         
         # Wait for all endpoints to be deleted
-        if all_endpoints:
-            logger.info(f"  Waiting for {len(all_endpoints)} VPC endpoint(s) to be deleted...")
-            max_wait = 300  # 5 minutes
-            waited = 0
-            
-            while waited < max_wait:
-                remaining_endpoints = []
-                
-                for endpoint in all_endpoints:
-                    try:
-                        current_endpoints = ec2_client.describe_vpc_endpoints(
-                            VpcEndpointIds=[endpoint["VpcEndpointId"]]
-                        )
-                        if current_endpoints.get("VpcEndpoints"):
-                            current_endpoint = current_endpoints["VpcEndpoints"][0]
-                            if current_endpoint["State"] not in ["deleted"]:
-                                remaining_endpoints.append(current_endpoint)
-                                logger.debug(f"    VPC endpoint {endpoint['VpcEndpointId']} still in state: {current_endpoint['State']}")
-                    except ClientError as e:
-                        if e.response["Error"]["Code"] == "InvalidVpcEndpointId.NotFound":
-                            logger.debug(f"    VPC endpoint {endpoint['VpcEndpointId']} confirmed deleted")
-                        else:
-                            logger.debug(f"    Error checking VPC endpoint {endpoint['VpcEndpointId']}: {e}")
-                
-                if not remaining_endpoints:
-                    logger.info("  ✓ All VPC endpoints deleted")
-                    break
-                
-                logger.info(f"    Still waiting for {len(remaining_endpoints)} VPC endpoint(s)... ({waited}s/{max_wait}s)")
-                time.sleep(30)
-                waited += 30
-            
-            if remaining_endpoints:
-                logger.warning(f"  ⚠ {len(remaining_endpoints)} VPC endpoint(s) still not deleted after {max_wait} seconds")
-                for endpoint in remaining_endpoints:
-                    logger.warning(f"    - {endpoint['VpcEndpointId']} (State: {endpoint['State']})")
+        logger.info(f"  Waiting for {len(all_endpoints)} VPC endpoint(s) to be deleted...")
+        max_wait = 300  # 5 minutes
+        remaining_endpoints = wait_for_vpc_endpoints_gone(
+            [endpoint["VpcEndpointId"] for endpoint in all_endpoints],
+            max_wait=max_wait
+        )
+
+        if remaining_endpoints:
+            logger.warning(f"  ⚠ {len(remaining_endpoints)} VPC endpoint(s) still not deleted after {max_wait} seconds")
+            for endpoint_id in remaining_endpoints:
+                logger.warning(f"    - {endpoint_id}")
+        else:
+            logger.info("  ✓ All VPC endpoints deleted")
         
         logger.info("✓ VPC endpoints processed")
     except Exception as e:
@@ -1386,42 +1738,25 @@ def wait_for_vpc_endpoint_deletion():
     logger.info("Checking for remaining VPC endpoints...")
     
     try:
-        # Check for the specific VPC endpoint that was deleting
-        endpoint_id = "vpce-0463dca454a0900e4"
+        # Find endpoints in project VPCs that are still deleting from an earlier run
+        endpoint_ids = [
+            endpoint["VpcEndpointId"] for endpoint in project_vpc_snapshot()["endpoints"]
+            if endpoint["State"] == "deleting"
+        ]
+        if not endpoint_ids:
+            return True
         
         max_wait = 300  # 5 minutes
-        waited = 0
-        
-        while waited < max_wait:
-            try:
-                endpoints = ec2_client.describe_vpc_endpoints(VpcEndpointIds=[endpoint_id])
-                if endpoints.get("VpcEndpoints"):
-                    endpoint = endpoints["VpcEndpoints"][0]
-                    if endpoint["State"] == "deleted":
-                        logger.info(f"  ✓ VPC endpoint {endpoint_id} is now deleted")
-                        break
-                    else:
-                        logger.info(f"  VPC endpoint {endpoint_id} still in state: {endpoint['State']} (waiting {waited}s/{max_wait}s)")
-                        time.sleep(30)
-                        waited += 30
-                else:
-                    logger.info(f"  ✓ VPC endpoint {endpoint_id} is deleted")
-                    break
-            except ClientError as e:
-                if e.response["Error"]["Code"] == "InvalidVpcEndpointId.NotFound":
-                    logger.info(f"  ✓ VPC endpoint {endpoint_id} confirmed deleted")
-                    break
-                else:
-                    logger.warning(f"  Error checking VPC endpoint: {e}")
-                    break
         
-        if waited >= max_wait:
-            logger.warning(f"  ⚠ VPC endpoint {endpoint_id} still not deleted after {max_wait} seconds")
+        remaining_endpoints = wait_for_vpc_endpoints_gone(endpoint_ids, max_wait=max_wait)
+        if remaining_endpoints:
+            logger.warning(f"  ⚠ VPC endpoint(s) {remaining_endpoints} still not deleted after {max_wait} seconds")
             return False
         
+        logger.info(f"  ✓ VPC endpoint(s) {endpoint_ids} confirmed deleted")
         return True
     except Exception as e:
-        logger.debug(f"Error waiting for VPC endpoint deletion: {e}")
+        logger.debug("Error waiting for VPC endpoint deletion: %s", e)
         return False
 
 def force_delete_specific_security_group():
@@ -1429,19 +1764,12 @@ def force_delete_specific_security_group():
     logger.info("Checking for remaining security groups blocking VPC deletion...")
     
     try:
-        # Find all security groups matching project name pattern
-        all_sgs = ec2_client.describe_security_groups()
-        remaining_sgs = []
-        
-        for sg in all_sgs.get("SecurityGroups", []):
-            sg_name = sg.get("GroupName", "")
-            # Check if security group name contains project name and is not default
-            if project_name in sg_name and sg_name != "default":
-                remaining_sgs.append({
-                    "GroupId": sg["GroupId"],
-                    "GroupName": sg_name,
-                    "VpcId": sg.get("VpcId")
-                })
+        # Find all security groups matching project name pattern, filtered server-side
+        all_sgs = describe_all(ec2_client, "describe_security_groups",
+            Filters=[{"Name": "group-name", "Values": [f"*{project_name}*"]}]
+        )
+        # Keep the full descriptions so their rules can be revoked without describing each group again
+        remaining_sgs = [sg for sg in all_sgs.get("SecurityGroups", []) if sg["GroupName"] != "default"]
         
         if not remaining_sgs:
             logger.info("  No remaining security groups found to delete")
@@ -1449,69 +1777,72 @@ def force_delete_specific_security_group():
         
         logger.info(f"  Found {len(remaining_sgs)} remaining security group(s) to force delete: {[sg['GroupName'] for sg in remaining_sgs]}")
         
+        # Look up every rule of the remaining groups by ID in one paginated call
+        rule_ids = {}  # (group ID, is egress) -> rule IDs
+        sg_rules = describe_all(ec2_client, "describe_security_group_rules",
+            Filters=[{"Name": "group-id", "Values": [sg["GroupId"] for sg in remaining_sgs]}]
+        )
+        for rule in sg_rules["SecurityGroupRules"]:
+            rule_ids.setdefault((rule["GroupId"], rule["IsEgress"]), []).append(rule["SecurityGroupRuleId"])
+        
+        # Likewise index the attached network interfaces by security group
+        enis_by_sg = {}
+        try:
+            enis = describe_all(ec2_client, "describe_network_interfaces",
+                Filters=[{"Name": "group-id", "Values": [sg["GroupId"] for sg in remaining_sgs]}]
+            )
+            for eni in enis["NetworkInterfaces"]:
+                for group in eni.get("Groups", []):
+                    enis_by_sg.setdefault(group["GroupId"], []).append(eni)
+        except ClientError as e:
+            if e.response["Error"]["Code"] in throttling_error_codes:
+                raise
+            logger.debug("    Could not check network interfaces: %s", e)
+        
+        def delete_eni(eni_id):
+            try:
+                ec2_client.delete_network_interface(NetworkInterfaceId=eni_id)
+                logger.info(f"  ✓ Deleted network interface: {eni_id}")
+            except ClientError as e:
+                if e.response["Error"]["Code"] in throttling_error_codes:
+                    raise
+                logger.debug("    Could not delete network interface %s: %s", eni_id, e)
+        
         # Force delete each remaining security group
-        for sg_info in remaining_sgs:
-            sg_id = sg_info["GroupId"]
-            sg_name = sg_info["GroupName"]
+        for sg in remaining_sgs:
+            sg_id = sg["GroupId"]
+            sg_name = sg["GroupName"]
             
             try:
-                # Get security group details
-                sg_detail = ec2_client.describe_security_groups(GroupIds=[sg_id])
-                if not sg_detail.get("SecurityGroups"):
-                    logger.debug(f"  Security group {sg_name} ({sg_id}) not found (already deleted)")
-                    continue
-                
-                sg = sg_detail["SecurityGroups"][0]
                 logger.info(f"  Force deleting security group: {sg_name} ({sg_id})")
                 
-                # Remove all rules first
-                if sg.get("IpPermissions"):
+                # Remove all rules first; the default egress rule goes too since the group is being deleted
+                for is_egress, revoke in [
+                    (False, ec2_client.revoke_security_group_ingress),
+                    (True, ec2_client.revoke_security_group_egress)
+                ]:
+                    if not rule_ids.get((sg_id, is_egress)):
+                        continue
+                    direction = "outbound" if is_egress else "inbound"
                     try:
-                        ec2_client.revoke_security_group_ingress(
-                            GroupId=sg_id,
-                            IpPermissions=sg["IpPermissions"]
-                        )
-                        logger.info(f"  ✓ Removed inbound rules from {sg_name}")
+                        revoke(GroupId=sg_id, SecurityGroupRuleIds=rule_ids[(sg_id, is_egress)])
+                        logger.info(f"  ✓ Removed {direction} rules from {sg_name}")
                     except ClientError as e:
-                        if e.response.get("Error", {}).get("Code") != "InvalidPermission.NotFound":
-                            logger.debug(f"    Could not remove inbound rules: {e}")
-                
-                if sg.get("IpPermissionsEgress"):
-                    egress_rules = [r for r in sg["IpPermissionsEgress"] 
-                                   if not (r.get("IpProtocol") == "-1" and 
-                                          len(r.get("IpRanges", [])) == 1 and
-                                          r["IpRanges"][0].get("CidrIp") == "0.0.0.0/0")]
-                    if egress_rules:
-                        try:
-                            ec2_client.revoke_security_group_egress(
-                                GroupId=sg_id,
-                                IpPermissions=egress_rules
-                            )
-                            logger.info(f"  ✓ Removed outbound rules from {sg_name}")
-                        except ClientError as e:
-                            if e.response.get("Error", {}).get("Code") != "InvalidPermission.NotFound":
-                                logger.debug(f"    Could not remove outbound rules: {e}")
-                
-                # Check for network interfaces and delete if available
-                try:
-                    enis = ec2_client.describe_network_interfaces(
-                        Filters=[{"Name": "group-id", "Values": [sg_id]}]
-                    )
-                    for eni in enis.get("NetworkInterfaces", []):
-                        if eni["Status"] == "available":
-                            try:
-                                ec2_client.delete_network_interface(NetworkInterfaceId=eni["NetworkInterfaceId"])
-                                logger.info(f"  ✓ Deleted network interface: {eni['NetworkInterfaceId']}")
-                            except:
-                                pass
-                except Exception as e:
-                    logger.debug(f"    Could not check network interfaces: {e}")
+                        if e.response.get("Error", {}).get("Code") not in not_found_error_codes:
+                            logger.debug("    Could not remove %s rules: %s", direction, e)
                 
-                time.sleep(10)
+                # Delete available network interfaces
+                run_parallel(delete_eni, [
+                    eni["NetworkInterfaceId"] for eni in enis_by_sg.get(sg_id, [])
+                    if eni["Status"] == "available"
+                ], max_workers=8)
                 
-                # Try to delete the security group with retry
+                # Try to delete the security group right away and back off only on DependencyViolation,
+                # which also covers rules in other groups that still reference this one.
+                # Attached network interfaces can take a while to release, so allow more attempts then.
+                max_attempts = 6 if enis_by_sg.get(sg_id) else 4
                 deleted = False
-                for attempt in range(3):
+                for attempt in range(max_attempts):
                     try:
                         ec2_client.delete_security_group(GroupId=sg_id)
                         logger.info(f"  ✓ Deleted security group: {sg_name} ({sg_id})")
@@ -1522,18 +1853,21 @@ def force_delete_specific_security_group():
                             logger.info(f"  Security group {sg_name} ({sg_id}) already deleted")
                             deleted = True
                             break
-                        elif attempt < 2:
-                            logger.info(f"  Retrying security group deletion in 15 seconds...")
-                            time.sleep(15)
+                        # Throttling is retried by the client config; only wait out detaching dependencies here
+                        elif e.response["Error"]["Code"] == "DependencyViolation" and attempt < max_attempts - 1:
+                            wait_time = backoff_delay(attempt)
+                            logger.info(f"  Retrying security group deletion in {wait_time:.0f} seconds...")
+                            time.sleep(wait_time)
                         else:
                             logger.warning(f"  Could not delete security group {sg_name} ({sg_id}): {e}")
+                            break
                 
                 if not deleted:
                     logger.warning(f"  ⚠ Failed to delete security group: {sg_name} ({sg_id})")
                     
             except ClientError as e:
                 if e.response["Error"]["Code"] == "InvalidGroupId.NotFound":
-                    logger.debug(f"  Security group {sg_name} ({sg_id}) not found (already deleted)")
+                    logger.debug("  Security group %s (%s) not found (already deleted)", sg_name, sg_id)
                 else:
                     logger.warning(f"  Error processing security group {sg_name} ({sg_id}): {e}")
             except Exception as e:
@@ -1541,32 +1875,7 @@ def force_delete_specific_security_group():
         
         logger.info("✓ Force delete security groups completed")
     except Exception as e:
-        logger.debug(f"Error in force delete specific security group: {e}")
-
-def force_delete_specific_vpc():
-    """Force delete the specific VPC that's having issues."""
-    logger.info("Attempting to force delete specific VPC...")
-    
-    vpc_id = "vpc-07bc97e641ca53b3c"  # The VPC we found earlier
-    
-    try:
-        # Check if VPC still exists
-        vpcs = ec2_client.describe_vpcs(VpcIds=[vpc_id])
-        if not vpcs.get("Vpcs"):
-            logger.info(f"  VPC {vpc_id} already deleted")
-            return True
-        
-        logger.info(f"  Found VPC to delete: {vpc_id}")
-        
-        # Force delete with comprehensive cleanup
-        return delete_single_vpc(vpc_id)
-    except ClientError as e:
-        if e.response["Error"]["Code"] == "InvalidVpcID.NotFound":
-            logger.info(f"  VPC {vpc_id} already deleted")
-            return True
-        else:
-            logger.error(f"  Error checking VPC {vpc_id}: {e}")
-            return False
+        logger.debug("Error in force delete specific security group: %s", e)
 
 def delete_iam_roles():
     """Delete IAM roles and policies."""
@@ -1580,23 +1889,35 @@ def delete_iam_roles():
         f"role-agentcore-memory-for-{project_name}-{region}"
     ]
     
-    for role_name in role_names:
+    def delete_role(role_name):
         try:
-            # Detach managed policies
-            attached_policies = iam_client.list_attached_role_policies(RoleName=role_name)
-            for policy in attached_policies["AttachedPolicies"]:
-                iam_client.detach_role_policy(
-                    RoleName=role_name,
-                    PolicyArn=policy["PolicyArn"]
-                )
+            # Detach managed policies concurrently
+            def detach_policy(policy_arn):
+                try:
+                    iam_client.detach_role_policy(
+                        RoleName=role_name,
+                        PolicyArn=policy_arn
+                    )
+                except ClientError as e:
+                    if e.response["Error"]["Code"] not in not_found_error_codes:
+                        raise
+
+            attached_policies = describe_all(iam_client, "list_attached_role_policies", RoleName=role_name)
+            run_parallel(detach_policy, [policy["PolicyArn"] for policy in attached_policies["AttachedPolicies"]], max_workers=10)
             
-            # Delete inline policies
-            inline_policies = iam_client.list_role_policies(RoleName=role_name)
-            for policy_name in inline_policies["PolicyNames"]:
-                iam_client.delete_role_policy(
-                    RoleName=role_name,
-                    PolicyName=policy_name
-                )
+            # Delete inline policies concurrently
+            def delete_inline_policy(policy_name):
+                try:
+                    iam_client.delete_role_policy(
+                        RoleName=role_name,
+                        PolicyName=policy_name
+                    )
+                except ClientError as e:
+                    if e.response["Error"]["Code"] not in not_found_error_codes:
+                        raise
+
+            inline_policies = describe_all(iam_client, "list_role_policies", RoleName=role_name)
+            run_parallel(delete_inline_policy, inline_policies["PolicyNames"], max_workers=10)
             
             # Remove from instance profile if exists
             instance_profile_name = f"instance-profile-{project_name}-{region}"
@@ -1605,15 +1926,19 @@ def delete_iam_roles():
                     InstanceProfileName=instance_profile_name,
                     RoleName=role_name
                 )
-            except:
-                pass
+            except ClientError as e:
+                if e.response["Error"]["Code"] in throttling_error_codes:
+                    raise
+                logger.debug("  Could not remove role %s from instance profile: %s", role_name, e)
             
             # Delete role
             iam_client.delete_role(RoleName=role_name)
             logger.info(f"  ✓ Deleted role: {role_name}")
         except ClientError as e:
-            if e.response["Error"]["Code"] != "NoSuchEntity":
+            if e.response["Error"]["Code"] not in not_found_error_codes:
                 logger.warning(f"  Could not delete role {role_name}: {e}")
+
+    run_parallel(delete_role, role_names, max_workers=8)
     
     # Delete instance profile
     try:
@@ -1621,7 +1946,7 @@ def delete_iam_roles():
         iam_client.delete_instance_profile(InstanceProfileName=instance_profile_name)
         logger.info(f"  ✓ Deleted instance profile: {instance_profile_name}")
     except ClientError as e:
-        if e.response["Error"]["Code"] != "NoSuchEntity":
+        if e.response["Error"]["Code"] not in not_found_error_codes:
             logger.warning(f"  Could not delete instance profile: {e}")
     
     logger.info("✓ IAM roles deleted")
@@ -1636,42 +1961,60 @@ def delete_s3_buckets():
         f"storage-for-{project_name}--{region}"  # storage-for-mcp--us-west-2 (when account_id is empty)
     ]
     
+    # One prefix-filtered listing tells which candidates exist, so missing ones cost no further calls
+    try:
+        existing_buckets = {
+            bucket["Name"] for bucket in describe_all(s3_client, "list_buckets",
+                Prefix=f"storage-for-{project_name}-"
+            )["Buckets"]
+        }
+    except ClientError as e:
+        logger.debug("  Could not list buckets, trying every candidate: %s", e)
+        existing_buckets = set(bucket_names)
+    
     for bucket in bucket_names:
+        if bucket not in existing_buckets:
+            logger.info(f"  Bucket {bucket} does not exist")
+    
+    def delete_bucket(bucket):
         try:
             # Delete all objects and versions
             try:
-                # List and delete all object versions
-                versions = s3_client.list_object_versions(Bucket=bucket)
-                delete_keys = []
-                
-                # Add current versions
-                if "Versions" in versions:
-                    for version in versions["Versions"]:
-                        delete_keys.append({
-                            "Key": version["Key"],
-                            "VersionId": version["VersionId"]
-                        })
+                # Stream each page of versions and delete markers into delete_objects batches
+                # (at most 1000 keys each) that run concurrently while listing continues.
+                # The semaphore caps in-flight batches so memory stays bounded on huge buckets.
+                in_flight = threading.BoundedSemaphore(16)
                 
-                # Add delete markers
-                if "DeleteMarkers" in versions:
-                    for marker in versions["DeleteMarkers"]:
-                        delete_keys.append({
-                            "Key": marker["Key"],
-                            "VersionId": marker["VersionId"]
-                        })
-                
-                # Delete in batches of 1000
-                if delete_keys:
-                    for i in range(0, len(delete_keys), 1000):
-                        batch = delete_keys[i:i+1000]
+                def delete_batch(batch):
+                    try:
                         s3_client.delete_objects(
                             Bucket=bucket,
                             Delete={"Objects": batch}
                         )
-                    logger.info(f"  ✓ Deleted {len(delete_keys)} objects/versions from {bucket}")
+                    finally:
+                        in_flight.release()
+                
+                deleted_count = 0
+                with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+                    futures = []
+                    for page in s3_client.get_paginator("list_object_versions").paginate(Bucket=bucket):
+                        delete_keys = [
+                            {"Key": version["Key"], "VersionId": version["VersionId"]}
+                            for version in page.get("Versions", []) + page.get("DeleteMarkers", [])
+                        ]
+                        for i in range(0, len(delete_keys), 1000):
+                            batch = delete_keys[i:i+1000]
+                            in_flight.acquire()
+                            futures.append(executor.submit(delete_batch, batch))
+                            deleted_count += len(batch)
+                    for future in futures:
+                        future.result()
+                
+                if deleted_count:
+                    logger.info(f"  ✓ Deleted {deleted_count} objects/versions from {bucket}")
                 
             except ClientError as e:
-                if e.response["Error"]["Code"] != "NoSuchBucket":
+                if e.response["Error"]["Code"] not in not_found_error_codes:
                     logger.warning(f"  Could not delete objects from {bucket}: {e}")
             
             # Delete bucket
@@ -1683,6 +2026,8 @@ def delete_s3_buckets():
                 logger.info(f"  Bucket {bucket} does not exist")
             else:
                 logger.warning(f"  Could not delete bucket {bucket}: {e}")
+
+    run_parallel(delete_bucket, [bucket for bucket in bucket_names if bucket in existing_buckets], max_workers=8)
     
     logger.info("✓ S3 buckets deleted")
 
@@ -1691,18 +2036,11 @@ def retry_vpc_deletion():
     logger.info("[9/9] Retrying VPC deletion after CloudFront cleanup")
     
     try:
-        # Find VPCs that still exist and match our project
-        vpc_name = f"vpc-for-{project_name}"
-        
-        # Check by tag name
-        vpcs_by_tag = ec2_client.describe_vpcs(
-            Filters=[{"Name": "tag:Name", "Values": [vpc_name]}]
-        )
-        
-        vpcs_to_retry = []
-        for vpc in vpcs_by_tag.get("Vpcs", []):
-            vpc_id = vpc["VpcId"]
-            vpcs_to_retry.append(vpc_id)
+        # Find VPCs that still exist and match our project; drop the cached lookup from before the deletions
+        project_vpc_ids.cache_clear()
+        project_vpc_snapshot.cache_clear()
+        vpcs_to_retry = list(project_vpc_ids())
+        for vpc_id in vpcs_to_retry:
             logger.info(f"  Found VPC to retry deletion: {vpc_id}")
         
         if not vpcs_to_retry:
@@ -1718,6 +2056,33 @@ def retry_vpc_deletion():
     except Exception as e:
         logger.error(f"Error during VPC deletion retry: {e}")
 
+def delete_vpc_endpoints():
+    """Wait for leftover VPC endpoints, then delete the project's endpoints."""
+    wait_for_vpc_endpoint_deletion()
+    delete_vpc_endpoints_and_wait()
+
+def delete_opensearch_and_knowledge_bases():
+    """Delete the OpenSearch collection and the Knowledge Bases backed by it."""
+    delete_opensearch_collection()
+    delete_knowledge_bases()
+
+# Teardown tasks and the tasks that must finish before each one can start
+teardown_tasks = {
+    "cloudfront": (process_cloudfront, []),
+    "alb": (delete_alb_resources, []),
+    "ec2_terminate": (delete_ec2_instances, []),
+    "nat": (delete_nat_gateways, ["alb", "ec2_terminate"]),
+    "endpoints": (delete_vpc_endpoints, []),
+    "security_groups": (delete_security_groups, ["alb", "ec2_terminate", "endpoints"]),
+    "route_tables": (delete_route_tables, ["nat"]),
+    "vpc": (delete_vpc_resources, ["nat", "endpoints", "security_groups", "route_tables"]),
+    "opensearch_kb": (delete_opensearch_and_knowledge_bases, []),
+    "code_interpreters": (delete_code_interpreters, []),
+    "secrets": (delete_secrets, []),
+    "s3": (delete_s3_buckets, ["opensearch_kb"]),
+    "iam": (delete_iam_roles, ["ec2_terminate", "opensearch_kb", "code_interpreters"]),
+}
+
 def main():
     """Main function to delete all infrastructure."""
     logger.info("="*60)
@@ -1731,34 +2096,19 @@ def main():
     start_time = time.time()
     
     try:
-        delete_cloudfront_distributions()
-        delete_alb_resources()
-        delete_ec2_instances()
-        delete_nat_gateways()
-        
-        # Wait for VPC endpoints to be deleted first
-        wait_for_vpc_endpoint_deletion()
-        delete_vpc_endpoints_and_wait()
-        
-        delete_security_groups()
-        delete_route_tables()
-        
-        failed_vpcs = delete_vpc_resources()
-        
-        delete_opensearch_collection()
-        delete_knowledge_bases()
-        # delete_code_interpreters()
-        delete_secrets()
-        delete_iam_roles()
-        delete_s3_buckets()
-        delete_disabled_cloudfront_distributions()
+        results, errors = run_dag(teardown_tasks)
+        failed_vpcs = results["vpc"]
         
         # Retry VPC deletion only if there were failures
-        if failed_vpcs:
-            logger.info(f"  VPC deletion failed for {len(failed_vpcs)} VPC(s): {failed_vpcs}")
+        if failed_vpcs or "vpc" in errors:
+            logger.info(f"  VPC deletion failed for {len(failed_vpcs or [])} VPC(s): {failed_vpcs}")
             logger.info("  Retrying VPC deletion after CloudFront cleanup...")
             retry_vpc_deletion()
         
+        # Every other step has run by now, so report the failed ones together
+        if errors:
+            raise RuntimeError(f"{len(errors)} teardown step(s) failed: {sorted(errors)}")
+        
         elapsed_time = time.time() - start_time
         logger.info("")
         logger.info("="*60)
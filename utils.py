@@ -1,9 +1,20 @@
+import json
 import logging
 import sys
-import json
 import boto3
 import os
 
+try:
+    import orjson
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(obj):
+        # match orjson: compact UTF-8 bytes
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
 logging.basicConfig(
     level=logging.INFO,  # Default to INFO level
     format='%(filename)s:%(lineno)d | %(message)s',
@@ -16,8 +27,8 @@ logger = logging.getLogger("utils")
 def load_config():
     config = None
     
-    with open("config.json", "r", encoding="utf-8") as f:
-        config = json.load(f)
+    with open("config.json", "rb") as f:
+        config = json_loads(f.read())
     
     return config
 
@@ -33,11 +44,19 @@ collectionArn = config['collectionArn']
 knowledge_base_role = config['knowledge_base_role']
 opensearch_url = config['opensearch_url']
 
+# parsed mcp.env, reused until the file's mtime or size changes
+mcp_env_cache = {}
+
 def load_mcp_env():
-    with open("mcp.env", "r", encoding="utf-8") as f:
-        mcp_env = json.load(f)
-    return mcp_env
+    st = os.stat("mcp.env")
+    key = (st.st_mtime_ns, st.st_size)
+    if mcp_env_cache.get("key") != key:
+        with open("mcp.env", "rb") as f:
+            mcp_env_cache["value"] = json_loads(f.read())
+        mcp_env_cache["key"] = key
+    # copy so callers can modify the result without touching the cache
+    return dict(mcp_env_cache["value"])
 
 def save_mcp_env(mcp_env):
-    with open("mcp.env", "w", encoding="utf-8") as f:
-        json.dump(mcp_env, f)
+    with open("mcp.env", "wb") as f:
+        f.write(json_dumps(mcp_env))